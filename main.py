@@ -9,56 +9,173 @@ License: The Open Software License 3.0 (OSL-3.0)
 
 import os
 import sys
+import queue
+import atexit
+import argparse
 import logging
+import logging.handlers
 import platform
-import datetime
+import threading
+import time
 import subprocess
+import concurrent.futures
 
-from PyQt6.QtCore import QSettings
-from PyQt6.QtWidgets import QApplication
 
-from src.gui.main_window import MainWindow
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that only calls time.strftime once per second and reuses the result for all records of that second
+    """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_time = ""
 
-def main():
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:    # NOQA
+        """
+        Format Creation Time of Record
+        """
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._cached_second = second
+        if datefmt or self.default_msec_format is None:
+            return self._cached_time
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+class BufferedFileHandler(logging.FileHandler):
     """
-    Start Main Window
+    FileHandler that opens its File on the first Record and writes through a large Buffer.
+    The Buffer is flushed for Warnings and above and otherwise at most every flush_interval seconds.
     """
-    app = QApplication(sys.argv)
-    app.setOrganizationName("AGWidera")
-    app.setApplicationName("MECA")
-    QSettings.setDefaultFormat(QSettings.Format.IniFormat)
 
-    for path in ["logs", "scripts"]:
-        os.makedirs(path, exist_ok=True)
+    def __init__(self, filename, flush_interval=1.0, buffer_size=65536):
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        super().__init__(filename, delay=True)
+        self._stop_event = threading.Event()
+        threading.Thread(target=self._flush_periodically, daemon=True).start()
 
-    # Logging Settings
-    if "--debug" in sys.argv:
-        logger_level = "DEBUG"
-    else:
-        logger_level = "WARNING"
-    logging.basicConfig(
-        level=logger_level,
-        format="%(asctime)s: [%(levelname)s] - %(message)s",
-        handlers=[
-            logging.FileHandler(os.path.join("logs", f"{datetime.datetime.now():%Y-%m-%d_%H-%M-%S}.log")),
-            logging.StreamHandler(sys.stdout),
-        ]
-    )
-
-    # Log Meta Info
+    def _open(self):
+        """
+        Open File with large Buffer
+        """
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding,
+                    errors=self.errors)
+
+    def _flush_periodically(self) -> None:
+        """
+        Flush Buffer every flush_interval seconds
+        """
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write Record to Buffer
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """
+        Stop periodic Flushing and close File
+        """
+        self._stop_event.set()
+        super().close()
+
+
+def get_version() -> str:
+    """
+    Get MECA Version.
+    Uses the version file written by 'make version' and only falls back to 'git describe' in dev checkouts.
+    """
+    try:
+        from src._version import __version__
+    except ImportError:
+        return subprocess.check_output(['git', 'describe', '--tags']).decode('ascii').strip()
+    return __version__
+
+
+def log_meta_info(git_tag: str) -> None:
+    """
+    Log System, Python and MECA Version
+    """
     system = platform.uname()
     logging.log(level=100, msg=f"System: {system.system}, Node Name: {system.node}, Release: {system.release}, "
                 f"Version: {system.version}, Machine: {system.machine}")
     python_version = sys.version.replace('\n', '')
     logging.log(level=100, msg=f"Python Version: {python_version}")
-    git_tag = subprocess.check_output(['git', 'describe', '--tags']).decode('ascii').strip()
     logging.log(level=100, msg=f"MECA Version: {git_tag}")
 
+
+def create_directories() -> None:
+    """
+    Create Log and Script Directories
+    """
+    for path in ["logs", "scripts"]:
+        os.makedirs(path, exist_ok=True)
+
+
+def main():
+    """
+    Start Main Window
+    """
+    # Unknown Arguments are passed on to Qt
+    parser = argparse.ArgumentParser(description="Microscope Experiment Control Application")
+    parser.add_argument("--debug", action="store_true", help="log debug messages")
+    parser.add_argument("--version", action="store_true", help="print version and exit")
+    args, _ = parser.parse_known_args()
+    if args.version:
+        print(get_version())
+        return
+
+    # The Version is read in the background while logging, Qt and the Main Window are set up.
+    # The Directories are needed right away by the Log File, so they are created inline.
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    future_version = executor.submit(get_version)
+    create_directories()
+
+    # Logging Settings
+    logger_level = "DEBUG" if args.debug else "WARNING"
+    # Records are only put into a queue on the calling thread, a listener thread writes them to file and stdout
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    formatter = CachedTimeFormatter("%(asctime)s: [%(levelname)s] - %(message)s")
+    file_handler = BufferedFileHandler(os.path.join("logs", time.strftime("%Y-%m-%d_%H-%M-%S.log")))
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in [file_handler, stream_handler]:
+        handler.setFormatter(formatter)
+    logging.basicConfig(level=logger_level, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Log Meta Info in the background, it overlaps with the construction of the Main Window
+    executor.submit(lambda: log_meta_info(future_version.result()))
+    executor.shutdown(wait=False)
+
+    # Qt and the Main Window (which transitively imports all GUI modules) are only loaded once they are needed
+    from PyQt6.QtCore import QSettings
+    from PyQt6.QtWidgets import QApplication
+    from src.gui.main_window import MainWindow
+
+    app = QApplication(sys.argv)
+    app.setOrganizationName("AGWidera")
+    app.setApplicationName("MECA")
+    QSettings.setDefaultFormat(QSettings.Format.IniFormat)
+
     # Start Main Window
     main_win = MainWindow()
+    git_tag = future_version.result()
     main_win.setWindowTitle(
-        f"Microscope Experiment Control Application - {git_tag}{' (Debug)' if '--debug' in sys.argv else ''}")
+        f"Microscope Experiment Control Application - {git_tag}{' (Debug)' if args.debug else ''}")
     main_win.show()
     sys.exit(app.exec())
 
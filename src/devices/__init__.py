@@ -1,22 +1,27 @@
-from .awg_keysight import AWGKeysight
-from .camera_andor import CameraAndor
-from .camera_thorlabs import CameraThorlabs
-from .camera_ximea import CameraXimea
-from .laser_cobolt import LaserCobolt
-from .laser_dlnsec import LaserDLNSEC
-from .laser_obis import LaserOBIS
-from .oscilloscope_keysight import OscilloscopeKeysight
-from .powersupply_voltcraft import PowersupplyVoltcraft
-from .pulsestreamer_stanford import PulsestreamerStanford
-from .pulsestreamer_swabian import PulsestreamerSwabian
-from .redpitaya_pulsecounter import RedPitayaPulsecounter
-from .rfg_windfreak import RFGWindfreak
-from .rfg_rohdeschwarz import RFGRohdeSchwarz
-from .rfg_rigol import RFGRigol
-from .slider_thorlabs import SliderThorlabs
-from .stage_conex import StageConex
-from .stage_thorlabs import StageThorlabs
-from .timetagger_swabian import TimetaggerSwabian
+import importlib
+
+# Device classes are imported on first access, so that importing this package does not load every vendor SDK
+_lazy = {
+    "AWGKeysight": ".awg_keysight",
+    "CameraAndor": ".camera_andor",
+    "CameraThorlabs": ".camera_thorlabs",
+    "CameraXimea": ".camera_ximea",
+    "LaserCobolt": ".laser_cobolt",
+    "LaserDLNSEC": ".laser_dlnsec",
+    "LaserOBIS": ".laser_obis",
+    "OscilloscopeKeysight": ".oscilloscope_keysight",
+    "PowersupplyVoltcraft": ".powersupply_voltcraft",
+    "PulsestreamerStanford": ".pulsestreamer_stanford",
+    "PulsestreamerSwabian": ".pulsestreamer_swabian",
+    "RedPitayaPulsecounter": ".redpitaya_pulsecounter",
+    "RFGWindfreak": ".rfg_windfreak",
+    "RFGRohdeSchwarz": ".rfg_rohdeschwarz",
+    "RFGRigol": ".rfg_rigol",
+    "SliderThorlabs": ".slider_thorlabs",
+    "StageConex": ".stage_conex",
+    "StageThorlabs": ".stage_thorlabs",
+    "TimetaggerSwabian": ".timetagger_swabian",
+}
 
 __all__ = [
     "AWGKeysight",
@@ -39,3 +44,34 @@ __all__ = [
     "StageThorlabs",
     "TimetaggerSwabian"
 ]
+
+
+def __getattr__(name):
+    """
+    Import Device Class on first Access
+    """
+    if name not in _lazy:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    try:
+        module = importlib.import_module(_lazy[name], __name__)
+    except ImportError as err:
+        obj = _missing_device(name, err)
+    else:
+        obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def _missing_device(name, import_error):
+    """
+    Placeholder for a Device Class whose vendor SDK is not installed.
+    Raises an ImportError when it is instantiated.
+    """
+    def __init__(self, *args, **kwargs):
+        raise ImportError(f"{name}: Vendor SDK not installed. Error: '{import_error}'.") from import_error
+
+    return type(name, (), {"__init__": __init__, "__doc__": f"{name} (not available)"})
+
+
+def __dir__():
+    return __all__
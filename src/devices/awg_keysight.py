@@ -2,35 +2,102 @@
 Keysight Arbitrary Waveform Generator
 """
 
-from PyQt6.QtCore import pyqtSlot, QTimer
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QComboBox, QFormLayout, QVBoxLayout, QMainWindow, QFrame
-
-from src.devices.main_device import EthernetDevice
+import time
+import logging
+import threading
+from functools import partial
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QSignalBlocker
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QComboBox, QFormLayout, QVBoxLayout, QMainWindow, QFrame, \
+    QStackedWidget
+
+from src.devices.main_device import EthernetDevice, convert_decimal_notation
+from src.devices.error_poller import ErrorPoller
+from src.devices.state_reader import StateReader
 from src.static_gui_elements.toggle_button import ToggleButton
 from src.static_gui_elements.delayed_spin_box import DelayedDoubleSpinBox
 
 
+@dataclass
+class ChannelState:
+    """
+    State of an AWG Channel
+    """
+    function: str
+    output: bool
+    burst_state: str
+    frequency: float
+    amplitude: float
+    offset: float
+    phase: float
+
+
 class AWGKeysight(EthernetDevice):
     """
     Arbitrary Waveform Generator by Keysight
     """
 
+    SUPPORTS_BATCHING = True
+
+    # SCPI Headers of numeric Parameters, '{channel}' is replaced by the Channel Number
+    _PARAMETERS = {
+        "frequency": "SOUR{channel}:FREQ",
+        "amplitude": "SOUR{channel}:VOLT",
+        "offset": "SOUR{channel}:VOLT:OFFS",
+        "phase": "SOUR{channel}:PHAS",
+        "square_duty_cycle": "SOUR{channel}:FUNC:SQU:DCYC",
+        "ramp_symmetry": "SOUR{channel}:FUNC:RAMP:SYMM",
+        "pulse_width": "SOUR{channel}:FUNC:PULS:WIDT",
+        "pulse_lead_edge": "SOUR{channel}:FUNC:PULS:TRAN:LEAD",
+        "pulse_trail_edge": "SOUR{channel}:FUNC:PULS:TRAN:TRA",
+        "trigger_count": "TRIG{channel}:COUN",
+        "trigger_delay": "TRIG{channel}:DEL",
+        "trigger_timer": "TRIG{channel}:TIM",
+        "burst_number_cycles": "SOUR{channel}:BURS:NCYC",
+    }
+
+    # Time in s after which cached Answers are read again, so Changes made on the Front Panel show up
+    CACHE_TTL = 0.5
+
     def __init__(self, name="AWG Keysight", address="", settings=None):
         super().__init__(name, address, settings)
+        self._cache = {}    # Cached Answers and their Time by Query, the matching Setter removes the Entry
+        self._cache_lock = threading.Lock()     # The Cache is used by the GUI and Worker Threads
 
         # Channel Names
         self.channel = ["1", "2"]
         if "Channel" in self.settings:
             for name, value in self.settings["Channel"].items():
                 self.channel[name - 1] = value
-
-        # Set maximum sample rate for arbitrary functions
-        model_nr = self.get_identification().split(',')[1]
+        self._channel_index = {name: index for index, name in enumerate(self.channel, start=1)}
+
+        # SCPI Headers and Queries of numeric Parameters by (Name, Channel Number)
+        self._headers = {
+            (name, channel): header.format(channel=channel)
+            for name, header in self._PARAMETERS.items() for channel in range(1, len(self.channel) + 1)
+        }
+        self._queries = {key: f"{header}?" for key, header in self._headers.items()}
+        # Prefixes of all Queries that belong to a Channel
+        self._channel_prefixes = {
+            channel: (f"SOUR{channel}:", f"OUTP{channel}?", f"TRIG{channel}:")
+            for channel in range(1, len(self.channel) + 1)
+        }
+
+        self._upload_executor = None    # Worker Thread of set_function_arbitrary_async, created on first use
+
+        # Set maximum sample rate for arbitrary functions, the Model can be given in the Settings to skip the Query
+        self._identification = None
+        model_nr = self.settings.get("Model") or self.get_identification().split(',')[1]
         if model_nr == "33622A":
             self.MAX_SRAT = 250E6
         else:
             self.MAX_SRAT = 62.5E6
 
+        # Binary Blocks are sent in the little endian Byte Order of the Host, so uploads need no Byte Swap
+        self.write("FORM:BORD SWAP")
+
     def get_error(self) -> str:
         """
         Get Last Error
@@ -47,15 +114,199 @@ class AWGKeysight(EthernetDevice):
         """
         if isinstance(channel, int):
             return channel
-        if isinstance(channel, str) and channel in self.channel:
-            return self.channel.index(channel) + 1
-        raise ValueError(f"{self.name}: Unknown Channel '{channel}'")
+        try:
+            return self._channel_index[channel]
+        except KeyError:
+            raise ValueError(f"{self.name}: Unknown Channel '{channel}'") from None
+
+    def _read_cached(self, message, convert=str):
+        """
+        Read Message from Device or return the cached Answer
+        :param str message: Query
+        :param convert: Function that converts the Answer before it is cached
+        """
+        value = self._cache_get(message)
+        if value is None:
+            value = convert(self.read(message))
+            self._cache_set(message, value)
+        return value
+
+    def _cache_get(self, message):
+        """
+        Return cached Answer of Query or None if it is not cached or older than CACHE_TTL
+        :param str message: Query
+        """
+        with self._cache_lock:
+            entry = self._cache.get(message)
+        if entry is not None and time.monotonic() - entry[1] < self.CACHE_TTL:
+            return entry[0]
+        return None
+
+    def _clear_channel_cache(self, channel):
+        """
+        Remove cached Answers of all Queries of a Channel
+        :param int channel: Channel Number
+        """
+        prefixes = self._channel_prefixes.get(channel)
+        with self._cache_lock:
+            if prefixes is None:
+                self._cache.clear()
+                return
+            for message in [message for message in list(self._cache) if message.startswith(prefixes)]:
+                self._cache.pop(message, None)
+
+    def _cache_set(self, message, value):
+        """
+        Cache Answer of Query
+        :param str message: Query
+        :param value: Answer
+        """
+        with self._cache_lock:
+            self._cache[message] = (value, time.monotonic())
+
+    def _write_if_changed(self, query, command, answer):
+        """
+        Write Command unless the cached Answer of Query already equals the Answer the Command leads to.
+        The Answer is cached afterwards, so repeating the same Setting is not written again.
+        :param str query: Query that reads the Setting back
+        :param str command: Command that changes the Setting
+        :param str answer: Answer of Query after the Command was written
+        """
+        # The Communication Lock makes Check and Write atomic, so no other Thread changes the Setting in between
+        with self._lock:
+            if self._cache_get(query) == answer:
+                return
+            self.write(command)
+            self._cache_set(query, answer)
+
+    def _set_parameter(self, name, channel, value):
+        """
+        Set numeric Parameter from _PARAMETERS
+        :param str name: Parameter Name
+        :param int channel: Channel Number
+        :param float | str value: Value, decimal commas are replaced by points
+        """
+        key = (name, channel)
+        if key in self._headers:
+            header, query = self._headers[key], self._queries[key]
+        else:
+            header = self._PARAMETERS[name].format(channel=channel)
+            query = f"{header}?"
+        value = convert_decimal_notation(value)
+        # The Device may round the Value, so it is only compared and not cached.
+        # The Communication Lock makes Check and Write atomic, so no other Thread changes the Setting in between.
+        with self._lock:
+            try:
+                if self._cache_get(query) == float(value):
+                    return
+            except ValueError:
+                pass
+            with self._cache_lock:
+                self._cache.pop(query, None)
+            self.write(f"{header} {value}")
+
+    def _get_parameter(self, name, channel):
+        """
+        Get numeric Parameter from _PARAMETERS
+        :param str name: Parameter Name
+        :param int channel: Channel Number
+        """
+        query = self._queries.get((name, channel)) or f"{self._PARAMETERS[name].format(channel=channel)}?"
+        return self._read_cached(query, float)
+
+    def _read_cached_batch(self, queries):
+        """
+        Read Queries that are not cached in one Message and return all Answers
+        :param dict queries: Function that converts the Answer before it is cached by Query
+        :return list: Answers in the Order of the Queries
+        """
+        answers = {query: self._cache_get(query) for query in queries}
+        missing = [query for query, answer in answers.items() if answer is None]
+        if missing:
+            for query, answer in zip(missing, self.read_batch(missing)):
+                answers[query] = queries[query](answer)
+                self._cache_set(query, answers[query])
+        return list(answers.values())
+
+    def get_parameters(self, channel, names):
+        """
+        Get multiple numeric Parameters from _PARAMETERS.
+        Parameters that are not cached are queried in one Message.
+        :param int channel: Channel Number
+        :param list names: Parameter Names
+        :return list: Values in the Order of the Names
+        """
+        queries = [
+            self._queries.get((name, channel)) or f"{self._PARAMETERS[name].format(channel=channel)}?" for name in names
+        ]
+        unique_queries = dict.fromkeys(queries, float)
+        answers = dict(zip(unique_queries, self._read_cached_batch(unique_queries)))
+        return [answers[query] for query in queries]
+
+    def get_common_params(self, channel):
+        """
+        Get Frequency in Hz, Amplitude in V, Offset in V and Phase in ° in one Query
+        :param int channel: Channel Number
+        """
+        return tuple(self.get_parameters(channel, ["frequency", "amplitude", "offset", "phase"]))
+
+    def get_pulse_params(self, channel):
+        """
+        Get Pulse Width, Lead Edge and Trail Edge in s in one Query
+        :param int channel: Channel Number
+        :return dict: Values by 'width', 'lead' and 'trail'
+        """
+        width, lead, trail = self.get_parameters(channel, ["pulse_width", "pulse_lead_edge", "pulse_trail_edge"])
+        return {"width": width, "lead": lead, "trail": trail}
+
+    def get_channel_state(self, channel):
+        """
+        Get Function, Output, Burst State and common Parameters of a Channel in one Query.
+        The Answers are cached, so the single Getters do not query the Device again.
+        :param int channel: Channel Number
+        :return ChannelState: Channel State
+        """
+        return self.get_channel_states([channel])[channel]
+
+    def get_channel_states(self, channels):
+        """
+        Get State of multiple Channels in one Query
+        :param list channels: Channel Numbers
+        :return dict: ChannelState by Channel Number
+        """
+        channel_queries = {channel: self._channel_state_queries(channel) for channel in channels}
+        queries = {}
+        for channel_query in channel_queries.values():
+            queries.update(channel_query)
+        answers = dict(zip(queries, self._read_cached_batch(queries)))
+        states = {}
+        for channel, channel_query in channel_queries.items():
+            function, output, burst_state, *parameters = [answers[query] for query in channel_query]
+            states[channel] = ChannelState(function, output.startswith("1"), burst_state, *parameters)
+        return states
+
+    def _channel_state_queries(self, channel):
+        """
+        Queries of a ChannelState in the Order of its Fields
+        :param int channel: Channel Number
+        :return dict: Function that converts the Answer by Query
+        """
+        queries = {
+            f"SOUR{channel}:FUNC?": str,
+            f"OUTP{channel}?": str,
+            f"SOUR{channel}:BURS:STAT?": str,
+        }
+        for name in ["frequency", "amplitude", "offset", "phase"]:
+            queries[self._queries.get((name, channel)) or f"{self._PARAMETERS[name].format(channel=channel)}?"] = float
+        return queries
 
     def get_identification(self):
         """
-        Get Identification String
+        Get Identification String, it is only queried once per Connection
         """
-        return self.read("*IDN?")
+        if self._identification is None:
+            self._identification = self.read("*IDN?")
+        return self._identification
 
     def clear(self):
         """
@@ -67,7 +318,9 @@ class AWGKeysight(EthernetDevice):
         """
         Reset Device to default Settings
         """
-        self.write("*RST")
+        with self._cache_lock:
+            self._cache.clear()
+        self.write_batch(["*RST", "FORM:BORD SWAP"])
 
     def trigger(self):
         """
@@ -83,180 +336,175 @@ class AWGKeysight(EthernetDevice):
         :param bool state: State
         """
         channel = self._convert_channel(channel)
-        self.write(f"OUTP{channel} {'ON' if state else 'OFF'}")
+        self._write_if_changed(f"OUTP{channel}?", f"OUTP{channel} {'ON' if state else 'OFF'}", "1" if state else "0")
 
     def get_output(self, channel: int) -> bool:
         """
         Get Output of channel 1|2
         """
-        return self.read(f"OUTP{channel}?") == "1"
+        return self._read_cached(f"OUTP{channel}?").startswith("1")
 
     def set_function(self, channel, function):
         """
-        Set Function SIN|SQU|TRI|RAMP|PULS|PRBS|NOIS|ARB|DC
+        Set Function SIN|SQU|TRI|RAMP|PULS|PRBS|NOIS|ARB|DC.
+        Nothing is written if the Device is known to be in this Function already.
         """
-        self.write(f"SOUR{channel}:FUNC {function}")
+        query = f"SOUR{channel}:FUNC?"
+        # The Communication Lock makes Check and Write atomic, so no other Thread changes the Function in between
+        with self._lock:
+            if self._cache_get(query) == function:
+                return
+            # Changing the Function can change other Parameters of the Channel that are out of range for the new one
+            self._clear_channel_cache(channel)
+            self.write(f"SOUR{channel}:FUNC {function}")
+            self._cache_set(query, function)
 
     def get_function(self, channel):
         """
         Get Function SIN|SQU|TRI|RAMP|PULS|PRBS|NOIS|ARB|DC
         """
-        return self.read(f"SOUR{channel}:FUNC?")
+        return self._read_cached(f"SOUR{channel}:FUNC?")
 
     def set_frequency(self, channel, frequency):
         """
         Set Frequency in Hz
         """
-        self.write(f"SOUR{channel}:FREQ {frequency}")
+        self._set_parameter("frequency", channel, frequency)
 
     def get_frequency(self, channel):
         """
         Get Frequency in Hz
         """
-        return float(self.read(f"SOUR{channel}:FREQ?"))
+        return self._get_parameter("frequency", channel)
 
     def set_amplitude(self, channel, amplitude):
         """
         Set Amplitude in V
         """
-        self.write(f"SOUR{channel}:VOLT {amplitude}")
+        self._set_parameter("amplitude", channel, amplitude)
 
     def get_amplitude(self, channel):
         """
         Get Amplitude in V
         """
-        return float(self.read(f"SOUR{channel}:VOLT?"))
+        return self._get_parameter("amplitude", channel)
 
     def set_offset(self, channel, offset):
         """
         Set Offset in V
         """
-        self.write(f"SOUR{channel}:VOLT:OFFS {offset}")
+        self._set_parameter("offset", channel, offset)
 
     def get_offset(self, channel: int) -> float:
         """
         Get Offset in V
         """
-        return float(self.read(f"SOUR{channel}:VOLT:OFFS?"))
+        return self._get_parameter("offset", channel)
 
     def set_phase(self, channel, phase):
         """
         Set Phase in °
         """
-        self.write(f"SOUR{channel}:PHAS {phase}")
+        self._set_parameter("phase", channel, phase)
 
     def get_phase(self, channel: int) -> float:
         """
         Get Phase in °
         """
-        return float(self.read(f"SOUR{channel}:PHAS?"))
+        return self._get_parameter("phase", channel)
 
     # Waveform Settings
     def set_square_duty_cycle(self, channel, duty_cycle):
         """
         Set Duty Cycle of Square Mode
         """
-        if isinstance(duty_cycle, str):
-            duty_cycle = duty_cycle.replace(',', '.')
-        self.write(f"SOUR{channel}:FUNC:SQU:DCYC {duty_cycle}")
+        self._set_parameter("square_duty_cycle", channel, duty_cycle)
 
     def get_square_duty_cycle(self, channel):
         """
         Get Duty Cycle of Square Mode
         """
-        return float(self.read(f"SOUR{channel}:FUNC:SQU:DCYC?"))
+        return self._get_parameter("square_duty_cycle", channel)
 
     def set_ramp_symmetry(self, channel, symmetry):
         """
         Set Symmetry of Ramp Mode
         """
-        if isinstance(symmetry, str):
-            symmetry = symmetry.replace(',', '.')
-        self.write(f"SOUR{channel}:FUNC:RAMP:SYMM {symmetry}")
+        self._set_parameter("ramp_symmetry", channel, symmetry)
 
     def get_ramp_symmetry(self, channel):
         """
         Get Symmetry of Ramp Mode
         """
-        return float(self.read(f"SOUR{channel}:FUNC:RAMP:SYMM?"))
+        return self._get_parameter("ramp_symmetry", channel)
 
     def set_pulse_width(self, channel, width):
         """
         Set Width of Pulse Mode
         """
-        if isinstance(width, str):
-            width = width.replace(',', '.')
-        self.write(f"SOUR{channel}:FUNC:PULS:WIDT {width}")
+        self._set_parameter("pulse_width", channel, width)
 
     def get_pulse_width(self, channel):
         """
         Get Width of Pulse Mode
         """
-        return float(self.read(f"SOUR{channel}:FUNC:PULS:WIDT?"))
+        return self._get_parameter("pulse_width", channel)
 
     def set_pulse_lead_edge(self, channel, lead_edge):
         """
         Set Lead Edge of Pulse Mode
         """
-        if isinstance(lead_edge, str):
-            lead_edge = lead_edge.replace(',', '.')
-        self.write(f"SOUR{channel}:FUNC:PULS:TRAN:LEAD {lead_edge}")
+        self._set_parameter("pulse_lead_edge", channel, lead_edge)
 
     def get_pulse_lead_edge(self, channel):
         """
         Get Lead Edge of Pulse Mode
         """
-        return float(self.read(f"SOUR{channel}:FUNC:PULS:TRAN:LEAD?"))
+        return self._get_parameter("pulse_lead_edge", channel)
 
     def set_pulse_trail_edge(self, channel, trail_edge):
         """
         Set Trail Edge of Pulse Mode
         """
-        if isinstance(trail_edge, str):
-            trail_edge = trail_edge.replace(',', '.')
-        self.write(f"SOUR{channel}:FUNC:PULS:TRAN:TRA {trail_edge}")
+        self._set_parameter("pulse_trail_edge", channel, trail_edge)
 
     def get_pulse_trail_edge(self, channel):
         """
         Get Trail Edge of Pulse Mode
         """
-        return float(self.read(f"SOUR{channel}:FUNC:PULS:TRAN:TRA?"))
+        return self._get_parameter("pulse_trail_edge", channel)
 
     # Trigger Settings
     def set_trigger_count(self, channel, count):
         """
         Set Trigger Count
         """
-        if isinstance(count, str):
-            count = count.replace(',', '.')
-        self.write(f"TRIG{channel}:COUN {count}")
+        self._set_parameter("trigger_count", channel, count)
 
     def get_trigger_count(self, channel):
         """
         Get Trigger Count
         """
-        return float(self.read(f"TRIG{channel}:COUN?"))
+        return self._get_parameter("trigger_count", channel)
 
     def set_trigger_delay(self, channel, delay):
         """
         Set Trigger Delay in s
         """
-        if isinstance(delay, str):
-            delay = delay.replace(',', '.')
-        self.write(f"TRIG{channel}:DEL {delay}")
+        self._set_parameter("trigger_delay", channel, delay)
 
     def get_trigger_delay(self, channel):
         """
         Get Trigger Delay in s
         """
-        return float(self.read(f"TRIG{channel}:DEL?"))
+        return self._get_parameter("trigger_delay", channel)
 
     def set_trigger_slope(self, channel, slope):
         """
         Set Trigger Slope POS | NEG
         """
         if slope.upper() in ["POS", "NEG"]:
-            self.write(f"TRIG{channel}:SLOP {slope.upper()}")
+            self._write_if_changed(f"TRIG{channel}:SLOP?", f"TRIG{channel}:SLOP {slope.upper()}", slope.upper())
         else:
             raise ValueError("Trigger Slope has to be 'POS' or 'NEG'")
 
@@ -264,14 +512,14 @@ class AWGKeysight(EthernetDevice):
         """
         Get Trigger Slope POS | NEG
         """
-        return float(self.read(f"TRIG{channel}:SLOP?"))
+        return self._read_cached(f"TRIG{channel}:SLOP?")
 
     def set_trigger_source(self, channel, source):
         """
         Set Trigger Source IMM | EXT | TIM | BUS
         """
         if source.upper() in ["IMM", "EXT", "TIM", "BUS"]:
-            self.write(f"TRIG{channel}:SOUR {source.upper()}")
+            self._write_if_changed(f"TRIG{channel}:SOUR?", f"TRIG{channel}:SOUR {source.upper()}", source.upper())
         else:
             raise ValueError("Trigger Source has to be 'IMM', 'EXT', 'TIM' or 'BUS'")
 
@@ -279,28 +527,27 @@ class AWGKeysight(EthernetDevice):
         """
         Get Trigger Source IMM | EXT | TIM | BUS
         """
-        return float(self.read(f"TRIG{channel}:SOUR?"))
+        return self._read_cached(f"TRIG{channel}:SOUR?")
 
     def set_trigger_timer(self, channel, timer):
         """
         Set Trigger Timer in s
         """
-        if isinstance(timer, str):
-            timer = timer.replace(',', '.')
-        self.write(f"TRIG{channel}:TIM {timer}")
+        self._set_parameter("trigger_timer", channel, timer)
 
     def get_trigger_timer(self, channel):
         """
         Get Trigger Timer in s
         """
-        return float(self.read(f"TRIG{channel}:TIM?"))
+        return self._get_parameter("trigger_timer", channel)
 
     def set_burst_state(self, channel, state):
         """
         Set Burst State ON | OFF
         """
         if state.upper() in ["ON", "OFF"]:
-            self.write(f"SOUR{channel}:BURS:STAT {state.upper()}")
+            answer = "1" if state.upper() == "ON" else "0"
+            self._write_if_changed(f"SOUR{channel}:BURS:STAT?", f"SOUR{channel}:BURS:STAT {state.upper()}", answer)
         else:
             raise ValueError("Burst State has to be 'ON' or 'OFF'")
 
@@ -308,27 +555,47 @@ class AWGKeysight(EthernetDevice):
         """
         Get Burst State
         """
-        return self.read(f"SOUR{channel}:BURS:STAT?")
+        return self._read_cached(f"SOUR{channel}:BURS:STAT?")
 
     def set_burst_number_cycles(self, channel, number_cycles):
         """
         Set Burst Number of Cycles
         """
-        if isinstance(number_cycles, str):
-            number_cycles = number_cycles.replace(',', '.')
-        self.write(f"SOUR{channel}:BURS:NCYC {number_cycles}")
+        self._set_parameter("burst_number_cycles", channel, number_cycles)
 
     def get_burst_number_cycles(self, channel):
         """
         Get Burst Number of Cycles
         """
-        return float(self.read(f"SOUR{channel}:BURS:NCYC?"))
+        return self._get_parameter("burst_number_cycles", channel)
 
     def get_burst_mode(self, channel):
         """
         Get Burst Mode
         """
-        return self.read(f"SOUR{channel}:BURS:MODE?")
+        return self._read_cached(f"SOUR{channel}:BURS:MODE?")
+
+    def configure_channels(self, configs):
+        """
+        Configure multiple Channels in one Message and wait until the Device applied all Settings.
+        The Function is set first, because it limits the Ranges of the other Parameters, and the Output last.
+        :param dict configs: Settings by Channel Name, each is a dict with the optional Keys 'function', 'output'
+            and the Parameter Names of _PARAMETERS, e.g. {1: {"function": "SIN", "frequency": 1e3, "output": True}}
+        """
+        commands = []
+        for channel, config in configs.items():
+            channel = self._convert_channel(channel)
+            self._clear_channel_cache(channel)
+            if "function" in config:
+                commands.append(f"SOUR{channel}:FUNC {config['function']}")
+            for name, value in config.items():
+                if name not in ["function", "output"]:
+                    header = self._headers.get((name, channel)) or self._PARAMETERS[name].format(channel=channel)
+                    commands.append(f"{header} {convert_decimal_notation(value)}")
+            if "output" in config:
+                commands.append(f"OUTP{channel} {'ON' if config['output'] else 'OFF'}")
+        # *OPC? is answered once all Commands before it are executed, so one Round Trip covers all Channels
+        self.read(";:".join(commands + ["*OPC?"]))
 
     # Burst and Trigger
     def set_trigger(self, channel=1, source="EXT", slope="POS"):
@@ -339,8 +606,8 @@ class AWGKeysight(EthernetDevice):
         :param str slope: Trigger Slope (POS | NEG)
         """
         channel = self._convert_channel(channel)
-        self.write(f"TRIG{channel}:SOURCE {source}")
-        self.write(f"TRIG{channel}:SLOPE {slope}")
+        self._clear_channel_cache(channel)
+        self.write_batch([f"TRIG{channel}:SOURCE {source}", f"TRIG{channel}:SLOPE {slope}"])
 
     def set_burst_mode(self, channel=1, number_cycles=1, mode="TRIG", state=False):
         """
@@ -351,9 +618,12 @@ class AWGKeysight(EthernetDevice):
         :param bool state: State
         """
         channel = self._convert_channel(channel)
-        self.write(f"SOUR{channel}:BURS:NCYC {number_cycles}")
-        self.write(f"SOUR{channel}:BURS:MODE {mode}")
-        self.write(f"SOUR{channel}:BURS:STAT {'ON' if state else 'OFF'}")
+        self._clear_channel_cache(channel)
+        self.write_batch([
+            f"SOUR{channel}:BURS:NCYC {number_cycles}",
+            f"SOUR{channel}:BURS:MODE {mode}",
+            f"SOUR{channel}:BURS:STAT {'ON' if state else 'OFF'}",
+        ])
 
     # Waveforms
     def set_constant_dc(self, channel=1, offset=0.0, state=False):
@@ -364,6 +634,7 @@ class AWGKeysight(EthernetDevice):
         :param bool state: Turn output on or off
         """
         channel = self._convert_channel(channel)
+        self._clear_channel_cache(channel)
         self.write(f"SOUR{channel}:APPL:DC DEF, DEF, {offset}V")
         self.set_output(channel=channel, state=state)
 
@@ -374,6 +645,7 @@ class AWGKeysight(EthernetDevice):
         :param bool state: TTL State (True = 3.3V | False = 0.0V)
         """
         channel = self._convert_channel(channel)
+        self._clear_channel_cache(channel)
         self.write(f"SOUR{channel}:APPL:DC DEF, DEF, {3.3 if state else 0.0}V")
 
     def set_function_pulse(self, channel=1, frequency=1.0, amplitude=1.0, offset=0.0, duty_cycle=50.0):
@@ -386,13 +658,15 @@ class AWGKeysight(EthernetDevice):
         :param float duty_cycle: Duty Cycle in %
         """
         channel = self._convert_channel(channel)
-
-        self.write(f"SOUR{channel}:FUNC PULS")
-        self.write(f"SOUR{channel}:FREQ {frequency}")
-        self.write(f"SOUR{channel}:VOLT {amplitude}")
-        self.write(f"SOUR{channel}:VOLT:OFFS {offset}")
-        self.write(f"SOUR{channel}:FUNC:PULS:DCYC {duty_cycle}")
-        self.write(f"SOUR{channel}:FUNC:PULS:HOLD DCYC")
+        self._clear_channel_cache(channel)
+        self.write_batch([
+            f"SOUR{channel}:FUNC PULS",
+            f"SOUR{channel}:FREQ {frequency}",
+            f"SOUR{channel}:VOLT {amplitude}",
+            f"SOUR{channel}:VOLT:OFFS {offset}",
+            f"SOUR{channel}:FUNC:PULS:DCYC {duty_cycle}",
+            f"SOUR{channel}:FUNC:PULS:HOLD DCYC",
+        ])
 
     def set_function_arbitrary(
             self, channel=1, amplitude=1.0, offset=0.0, sequence=None, sample_rate=None,
@@ -416,21 +690,48 @@ class AWGKeysight(EthernetDevice):
         :param bool output_state: Output State
         """
         channel = self._convert_channel(channel)
+        self._clear_channel_cache(channel)
         if sample_rate is None:
             sample_rate = self.MAX_SRAT
-        arb_str = sequence.get_sequence_keysight_awg(sample_rate)
-
-        self.write(f"SOUR{channel}:DATA:VOL:CLE")
-        self.write(f"SOUR{channel}:DATA:ARB myArb, {arb_str}")
-        self.write(f"SOUR{channel}:FUNC:ARB myArb")
-        self.write(f"SOUR{channel}:FUNC ARB")
-        self.write(f"SOUR{channel}:FUNC:ARB:FILT OFF")
-        self.write(f"SOUR{channel}:FUNC:ARB:SRAT {sample_rate}")
-        self.write(f"SOUR{channel}:VOLT {amplitude}")
-        self.write(f"SOUR{channel}:VOLT:OFFS {offset}")
-        self.set_trigger(channel=channel, source=trigger_source, slope=trigger_slope)
-        self.set_burst_mode(channel=channel, number_cycles=burst_cycles, mode=burst_mode, state=burst_state)
-        self.set_output(channel=channel, state=output_state)
+        arb_dac = sequence.get_sequence_keysight_awg_dac(sample_rate)
+
+        # The waveform data is sent as binary block of little endian DAC values, the Byte Order was set to SWAP in
+        # __init__. Clearing the volatile memory is prepended to the same message. All other settings are sent in one
+        # message after it.
+        self.write_binary(f"SOUR{channel}:DATA:VOL:CLE;:SOUR{channel}:DATA:ARB:DAC myArb, ", arb_dac,
+                          datatype='h', is_big_endian=False)
+        self.write_batch([
+            f"SOUR{channel}:FUNC:ARB myArb",
+            f"SOUR{channel}:FUNC ARB",
+            f"SOUR{channel}:FUNC:ARB:FILT OFF",
+            f"SOUR{channel}:FUNC:ARB:SRAT {sample_rate}",
+            f"SOUR{channel}:VOLT {amplitude}",
+            f"SOUR{channel}:VOLT:OFFS {offset}",
+            f"TRIG{channel}:SOURCE {trigger_source}",
+            f"TRIG{channel}:SLOPE {trigger_slope}",
+            f"SOUR{channel}:BURS:NCYC {burst_cycles}",
+            f"SOUR{channel}:BURS:MODE {burst_mode}",
+            f"SOUR{channel}:BURS:STAT {'ON' if burst_state else 'OFF'}",
+            f"OUTP{channel} {'ON' if output_state else 'OFF'}",
+        ])
+
+    def set_function_arbitrary_async(self, *args, **kwargs):
+        """
+        Run set_function_arbitrary on a Worker Thread, so the Caller is not blocked while the Waveform is uploaded.
+        Takes the same Arguments as set_function_arbitrary. Uploads are run one after another.
+        :return concurrent.futures.Future: Done when the Waveform is set, holds the Exception if that failed
+        """
+        if self._upload_executor is None:
+            self._upload_executor = ThreadPoolExecutor(max_workers=1)
+        return self._upload_executor.submit(self.set_function_arbitrary, *args, **kwargs)
+
+    def disconnect(self):
+        """
+        Wait for running Uploads and disconnect from Device
+        """
+        if self._upload_executor is not None:
+            self._upload_executor.shutdown(wait=True)
+        super().disconnect()
 
     def gui_open(self):
         """
@@ -441,10 +742,44 @@ class AWGKeysight(EthernetDevice):
 
 class WaveformKeysightDualWindow(QMainWindow):
 
+    # Parameters of a Waveform read on the Worker Thread: Channel, Waveform, Values
+    _parameters_ready = pyqtSignal(int, str, list)
+    # Waveform that could not be set on the Worker Thread: Channel, Waveform
+    _waveform_failed = pyqtSignal(int, str)
+
+    # Rows (Label, Decimals, Range, Parameter Name) of the Parameter Form of each Waveform
+    _COMMON_PARAMETERS = [
+        ("Frequency / Hz", 6, (1e-6, 30e6), "frequency"),
+        ("Amplitude / V", 3, (1e-3, 5), "amplitude"),
+        ("Offset / V", 3, (-5, 5), "offset"),
+        ("Phase / °", 3, (0, 360), "phase"),
+    ]
+    _FORM_PARAMETERS = {
+        "SIN": _COMMON_PARAMETERS,
+        "SQU": _COMMON_PARAMETERS + [("Duty Cycle / %", 2, (0.05, 99.95), "square_duty_cycle")],
+        "TRI": _COMMON_PARAMETERS,
+        "RAMP": _COMMON_PARAMETERS + [("Symmetry / %", 2, (0, 100), "ramp_symmetry")],
+        "PULS": _COMMON_PARAMETERS + [
+            ("Width / s", 9, (5e-9, 1e6), "pulse_width"),
+            ("Lead Edge / s", 9, (3e-9, 1e6), "pulse_lead_edge"),
+            ("Trail Edge / s", 9, (3e-9, 1e6), "pulse_trail_edge"),
+        ],
+        "DC": [("Offset / V", 4, (-5, 5), "offset")],
+    }
+
     def __init__(self, device: AWGKeysight):
         super().__init__()
         # Variables
         self._device = device
+        # Setters of the Widgets are run one after another on a Worker Thread, so the GUI does not block on Device I/O
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Setters waiting for the Worker Thread by (Setter Name, Channel), a newer Value replaces the waiting one
+        self._pending_writes: dict[tuple[str, object], tuple] = {}
+        self._pending_writes_lock = threading.Lock()
+        self._error_poller = None
+        self._state_reader = None
+        self._parameters_ready.connect(self._handle_parameters_ready)    # NOQA
+        self._waveform_failed.connect(self._handle_waveform_failed)    # NOQA
 
         # Appearance
         self.setWindowTitle(f"{self._device.name}")
@@ -453,12 +788,16 @@ class WaveformKeysightDualWindow(QMainWindow):
         # Channel 1
         widget_combo_box_ch1 = QWidget()
         layout_combo_box_ch1 = QFormLayout()
-        self._widget_form_ch1 = QWidget()
+        # Parameter Forms of each Channel, built on first use of a Waveform
+        self._forms: dict[int, dict[str, tuple[QWidget, list]]] = {1: {}, 2: {}}
+        # Waveform shown and set on the Device, and Waveform waiting for the Worker Thread by Channel
+        self._current_waveform = {1: None, 2: None}
+        self._requested_waveform = {1: None, 2: None}
+        self._widget_form_ch1 = QStackedWidget()
         self._layout_ch1 = QVBoxLayout()
         layout_combo_box_ch1.addRow(QLabel("<b>Channel 1</b>"))
         self._combo_box_waveform_ch1 = QComboBox()
         self._combo_box_waveform_ch1.addItems(["SIN", "SQU", "TRI", "RAMP", "PULS", "PRBS", "NOIS", "ARB", "DC"])
-        self._combo_box_waveform_ch1.setCurrentText(self._device.get_function(channel=1))
         self._combo_box_waveform_ch1.currentIndexChanged.connect(lambda: self._handle_waveform_changed(channel=1))  # NOQA
         layout_combo_box_ch1.addRow(QLabel("Waveform"), self._combo_box_waveform_ch1)
         widget_combo_box_ch1.setLayout(layout_combo_box_ch1)
@@ -466,12 +805,12 @@ class WaveformKeysightDualWindow(QMainWindow):
         widget_burst_ch1 = QWidget()
         layout_burst_ch1 = QFormLayout()
         layout_burst_ch1.addWidget(QLabel("Burst Settings"))
-        combo_box_burst_state_ch1 = QComboBox()
-        combo_box_burst_state_ch1.addItems(["ON", "OFF"])
-        combo_box_burst_state_ch1.setCurrentText(self._device.get_burst_state(channel=1))
-        combo_box_burst_state_ch1.currentIndexChanged.connect(  # NOQA
-            lambda: self._device.set_burst_state(channel=1, state=combo_box_burst_state_ch1.currentText()))
-        layout_burst_ch1.addWidget(combo_box_burst_state_ch1)
+        self._combo_box_burst_state_ch1 = QComboBox()
+        self._combo_box_burst_state_ch1.addItems(["ON", "OFF"])
+        self._combo_box_burst_state_ch1.currentIndexChanged.connect(  # NOQA
+            lambda: self._write_async(
+                self._device.set_burst_state, channel=1, state=self._combo_box_burst_state_ch1.currentText()))
+        layout_burst_ch1.addWidget(self._combo_box_burst_state_ch1)
         widget_burst_ch1.setLayout(layout_burst_ch1)
 
         # Separator
@@ -482,24 +821,23 @@ class WaveformKeysightDualWindow(QMainWindow):
         # Channel 2
         widget_combo_box_ch2 = QWidget()
         layout_combo_box_ch2 = QFormLayout()
-        self._widget_form_ch2 = QWidget()
+        self._widget_form_ch2 = QStackedWidget()
         self._layout_ch2 = QVBoxLayout()
         layout_combo_box_ch2.addRow(QLabel("<b>Channel 2</b>"))
         self._combo_box_waveform_ch2 = QComboBox()
         self._combo_box_waveform_ch2.addItems(["SIN", "SQU", "TRI", "RAMP", "PULS", "PRBS", "NOIS", "ARB", "DC"])
-        self._combo_box_waveform_ch2.setCurrentText(self._device.get_function(channel=2))
         self._combo_box_waveform_ch2.currentIndexChanged.connect(lambda: self._handle_waveform_changed(channel=2))  # NOQA
         layout_combo_box_ch2.addRow(QLabel("Waveform"), self._combo_box_waveform_ch2)
         widget_combo_box_ch2.setLayout(layout_combo_box_ch2)
 
         # Output Buttons
-        self._button_output_ch1 = ToggleButton(state=self._device.get_output(channel=1))
+        self._button_output_ch1 = ToggleButton()
         self._button_output_ch1.clicked.connect(    # NOQA
-            lambda: self._device.set_output(channel=1, state=self._button_output_ch1.isChecked())
+            lambda checked: self._write_async(self._device.set_output, channel=1, state=checked)
         )
-        self._button_output_ch2 = ToggleButton(state=self._device.get_output(channel=2))
+        self._button_output_ch2 = ToggleButton()
         self._button_output_ch2.clicked.connect(    # NOQA
-            lambda: self._device.set_output(channel=2, state=self._button_output_ch2.isChecked())
+            lambda checked: self._write_async(self._device.set_output, channel=2, state=checked)
         )
 
         # Total Layout
@@ -521,260 +859,236 @@ class WaveformKeysightDualWindow(QMainWindow):
         layout.addWidget(widget_ch2)
         widget = QWidget()
         widget.setLayout(layout)
+        widget.setEnabled(False)
         self.setCentralWidget(widget)
 
         # Status Bar
-        self._last_error = self._device.get_error()
+        self._last_error = ''
         self._status_bar_label = QLabel()
         self.statusBar().addWidget(self._status_bar_label)
 
-        # Status Bar Timer
-        self._timer = QTimer()
-        self._timer.timeout.connect(self._update_error_label)  # NOQA
-        self._timer.start(2000)
+        # Status Bar, the Error is queried by the shared ErrorPoller so the GUI does not block
+        self._error_poller = ErrorPoller.instance()
+        self._error_poller.error_occurred.connect(self._handle_device_error, Qt.ConnectionType.QueuedConnection)  # NOQA
+        self._error_poller.register(self._device)
+
+        # Initialization, the Device State is read on a Worker Thread and filled in when it is ready
+        self._state_reader = StateReader(self._device, self._read_state)
+        self._state_reader.state_ready.connect(self._handle_state_ready, Qt.ConnectionType.QueuedConnection)  # NOQA
+        self._state_reader.state_failed.connect(self._handle_state_failed, Qt.ConnectionType.QueuedConnection)  # NOQA
+        self._state_reader.start()
+
+        self.show()
+
+    def _read_state(self):
+        """
+        Read Device State shown in the Window. Runs on the Worker Thread of the StateReader.
+        """
+        channel_state = self._device.get_channel_states([1, 2])
+        return {
+            "function": {channel: channel_state[channel].function for channel in [1, 2]},
+            "output": {channel: channel_state[channel].output for channel in [1, 2]},
+            # The Device answers '0' or '1', the Combo Box shows 'ON' or 'OFF'
+            "burst_state": "ON" if channel_state[1].burst_state.startswith("1") else "OFF",
+            "error": self._device.get_error(),
+        }
+
+    @pyqtSlot(dict)
+    def _handle_state_ready(self, state):
+        """
+        Fill Widgets with Device State without writing it back to the Device
+        """
+        for combo_box, text in [(self._combo_box_waveform_ch1, state["function"][1]),
+                                (self._combo_box_waveform_ch2, state["function"][2]),
+                                (self._combo_box_burst_state_ch1, state["burst_state"])]:
+            with QSignalBlocker(combo_box):
+                combo_box.setCurrentText(text)
+        self._button_output_ch1.setChecked(state["output"][1])
+        self._button_output_ch2.setChecked(state["output"][2])
+        if state["error"]:
+            self._update_error_label(state["error"])
 
-        # Initialization
         self._handle_waveform_changed(channel=1)
         self._handle_waveform_changed(channel=2)
+        self.centralWidget().setEnabled(True)
 
-        self.show()
+    @pyqtSlot(str)
+    def _handle_state_failed(self, err):
+        """
+        Show Error of the failed State Read and enable the Widgets anyway, so Settings can still be written
+        """
+        self._update_error_label(err)
+        self.centralWidget().setEnabled(True)
 
     @pyqtSlot()
     def _handle_waveform_changed(self, channel):
         """
-        Replace Parameter Form according to selected Waveform
+        Set selected Waveform on the Worker Thread and show its Parameter Form when the Parameters are read.
+        The Form of each Waveform is built on first use and reused afterwards.
         """
-        widget_new = QWidget()
-        layout_new = QFormLayout()
-        widget_new.setLayout(layout_new)
-
         if channel == 1:
             waveform = self._combo_box_waveform_ch1.currentText()
         else:
             waveform = self._combo_box_waveform_ch2.currentText()
-
-        self._device.set_function(channel, function=waveform)
-
-        # Create Layout depending on selected Waveform
-        if waveform == "SIN":
-            line_edit_frequency = DelayedDoubleSpinBox()
-            line_edit_frequency.setDecimals(6)
-            line_edit_frequency.setRange(1e-6, 30e6)
-            line_edit_frequency.setValue(self._device.get_frequency(channel))
-            line_edit_frequency.textChanged.connect(  # NOQA
-                lambda: self._device.set_frequency(channel, line_edit_frequency.value()))
-            layout_new.addRow(QLabel("Frequency / Hz"), line_edit_frequency)
-            line_edit_amplitude = DelayedDoubleSpinBox()
-            line_edit_amplitude.setDecimals(3)
-            line_edit_amplitude.setRange(1e-3, 5)
-            line_edit_amplitude.setValue(self._device.get_amplitude(channel))
-            line_edit_amplitude.textChanged.connect(  # NOQA
-                lambda: self._device.set_amplitude(channel, line_edit_amplitude.value()))
-            layout_new.addRow(QLabel("Amplitude / V"), line_edit_amplitude)
-            line_edit_offset = DelayedDoubleSpinBox()
-            line_edit_offset.setDecimals(3)
-            line_edit_offset.setRange(-5, 5)
-            line_edit_offset.setValue(self._device.get_offset(channel))
-            line_edit_offset.textChanged.connect(lambda: self._device.set_offset(channel, line_edit_offset.value()))  # NOQA
-            layout_new.addRow(QLabel("Offset / V"), line_edit_offset)
-            line_edit_phase = DelayedDoubleSpinBox()
-            line_edit_phase.setDecimals(3)
-            line_edit_phase.setRange(0, 360)
-            line_edit_phase.setValue(self._device.get_phase(channel))
-            line_edit_phase.textChanged.connect(lambda: self._device.set_phase(channel, line_edit_phase.value()))  # NOQA
-            layout_new.addRow(QLabel("Phase / °"), line_edit_phase)
-
-        elif waveform == "SQU":
-            line_edit_frequency = DelayedDoubleSpinBox()
-            line_edit_frequency.setDecimals(6)
-            line_edit_frequency.setRange(1e-6, 30e6)
-            line_edit_frequency.setValue(self._device.get_frequency(channel))
-            line_edit_frequency.textChanged.connect(  # NOQA
-                lambda: self._device.set_frequency(channel, line_edit_frequency.value()))
-            layout_new.addRow(QLabel("Frequency / Hz"), line_edit_frequency)
-            line_edit_amplitude = DelayedDoubleSpinBox()
-            line_edit_amplitude.setDecimals(3)
-            line_edit_amplitude.setRange(1e-3, 5)
-            line_edit_amplitude.setValue(self._device.get_amplitude(channel))
-            line_edit_amplitude.textChanged.connect(  # NOQA
-                lambda: self._device.set_amplitude(channel, line_edit_amplitude.value()))
-            layout_new.addRow(QLabel("Amplitude / V"), line_edit_amplitude)
-            line_edit_offset = DelayedDoubleSpinBox()
-            line_edit_offset.setDecimals(3)
-            line_edit_offset.setRange(-5, 5)
-            line_edit_offset.setValue(self._device.get_offset(channel))
-            line_edit_offset.textChanged.connect(lambda: self._device.set_offset(channel, line_edit_offset.value()))  # NOQA
-            layout_new.addRow(QLabel("Offset / V"), line_edit_offset)
-            line_edit_phase = DelayedDoubleSpinBox()
-            line_edit_phase.setDecimals(3)
-            line_edit_phase.setRange(0, 360)
-            line_edit_phase.setValue(self._device.get_phase(channel))
-            line_edit_phase.textChanged.connect(lambda: self._device.set_phase(channel, line_edit_phase.value()))  # NOQA
-            layout_new.addRow(QLabel("Phase / °"), line_edit_phase)
-            line_edit_duty_cycle = DelayedDoubleSpinBox()
-            line_edit_duty_cycle.setDecimals(2)
-            line_edit_duty_cycle.setRange(0.05, 99.95)
-            line_edit_duty_cycle.setValue(self._device.get_square_duty_cycle(channel))
-            line_edit_duty_cycle.textChanged.connect(  # NOQA
-                lambda: self._device.set_square_duty_cycle(channel, line_edit_duty_cycle.value()))
-            layout_new.addRow(QLabel("Duty Cycle / %"), line_edit_duty_cycle)
-
-        elif waveform == "TRI":
-            line_edit_frequency = DelayedDoubleSpinBox()
-            line_edit_frequency.setDecimals(6)
-            line_edit_frequency.setRange(1e-6, 30e6)
-            line_edit_frequency.setValue(self._device.get_frequency(channel))
-            line_edit_frequency.textChanged.connect(  # NOQA
-                lambda: self._device.set_frequency(channel, line_edit_frequency.value()))
-            layout_new.addRow(QLabel("Frequency / Hz"), line_edit_frequency)
-            line_edit_amplitude = DelayedDoubleSpinBox()
-            line_edit_amplitude.setDecimals(3)
-            line_edit_amplitude.setRange(1e-3, 5)
-            line_edit_amplitude.setValue(self._device.get_amplitude(channel))
-            line_edit_amplitude.textChanged.connect(  # NOQA
-                lambda: self._device.set_amplitude(channel, line_edit_amplitude.value()))
-            layout_new.addRow(QLabel("Amplitude / V"), line_edit_amplitude)
-            line_edit_offset = DelayedDoubleSpinBox()
-            line_edit_offset.setDecimals(3)
-            line_edit_offset.setRange(-5, 5)
-            line_edit_offset.setValue(self._device.get_offset(channel))
-            line_edit_offset.textChanged.connect(lambda: self._device.set_offset(channel, line_edit_offset.value()))  # NOQA
-            layout_new.addRow(QLabel("Offset / V"), line_edit_offset)
-            line_edit_phase = DelayedDoubleSpinBox()
-            line_edit_phase.setDecimals(3)
-            line_edit_phase.setRange(0, 360)
-            line_edit_phase.setValue(self._device.get_phase(channel))
-            line_edit_phase.textChanged.connect(lambda: self._device.set_phase(channel, line_edit_phase.value()))  # NOQA
-            layout_new.addRow(QLabel("Phase / °"), line_edit_phase)
-
-        elif waveform == "RAMP":
-            line_edit_frequency = DelayedDoubleSpinBox()
-            line_edit_frequency.setDecimals(6)
-            line_edit_frequency.setRange(1e-6, 30e6)
-            line_edit_frequency.setValue(self._device.get_frequency(channel))
-            line_edit_frequency.textChanged.connect(  # NOQA
-                lambda: self._device.set_frequency(channel, line_edit_frequency.value()))
-            layout_new.addRow(QLabel("Frequency / Hz"), line_edit_frequency)
-            line_edit_amplitude = DelayedDoubleSpinBox()
-            line_edit_amplitude.setDecimals(3)
-            line_edit_amplitude.setRange(1e-3, 5)
-            line_edit_amplitude.setValue(self._device.get_amplitude(channel))
-            line_edit_amplitude.textChanged.connect(  # NOQA
-                lambda: self._device.set_amplitude(channel, line_edit_amplitude.value()))
-            layout_new.addRow(QLabel("Amplitude / V"), line_edit_amplitude)
-            line_edit_offset = DelayedDoubleSpinBox()
-            line_edit_offset.setDecimals(3)
-            line_edit_offset.setRange(-5, 5)
-            line_edit_offset.setValue(self._device.get_offset(channel))
-            line_edit_offset.textChanged.connect(lambda: self._device.set_offset(channel, line_edit_offset.value()))  # NOQA
-            layout_new.addRow(QLabel("Offset / V"), line_edit_offset)
-            line_edit_phase = DelayedDoubleSpinBox()
-            line_edit_phase.setDecimals(3)
-            line_edit_phase.setRange(0, 360)
-            line_edit_phase.setValue(self._device.get_phase(channel))
-            line_edit_phase.textChanged.connect(lambda: self._device.set_phase(channel, line_edit_phase.value()))  # NOQA
-            layout_new.addRow(QLabel("Phase / °"), line_edit_phase)
-            line_edit_symmetry = DelayedDoubleSpinBox()
-            line_edit_symmetry.setDecimals(2)
-            line_edit_symmetry.setRange(0, 100)
-            line_edit_symmetry.setValue(self._device.get_ramp_symmetry(channel))
-            line_edit_symmetry.textChanged.connect(  # NOQA
-                lambda: self._device.set_ramp_symmetry(channel, line_edit_symmetry.value()))
-            layout_new.addRow(QLabel("Symmetry / %"), line_edit_symmetry)
-
-        elif waveform == "PULS":
-            line_edit_frequency = DelayedDoubleSpinBox()
-            line_edit_frequency.setDecimals(6)
-            line_edit_frequency.setRange(1e-6, 30e6)
-            line_edit_frequency.setValue(self._device.get_frequency(channel))
-            line_edit_frequency.textChanged.connect(  # NOQA
-                lambda: self._device.set_frequency(channel, line_edit_frequency.value()))
-            layout_new.addRow(QLabel("Frequency / Hz"), line_edit_frequency)
-            line_edit_amplitude = DelayedDoubleSpinBox()
-            line_edit_amplitude.setDecimals(3)
-            line_edit_amplitude.setRange(1e-3, 5)
-            line_edit_amplitude.setValue(self._device.get_amplitude(channel))
-            line_edit_amplitude.textChanged.connect(  # NOQA
-                lambda: self._device.set_amplitude(channel, line_edit_amplitude.value()))
-            layout_new.addRow(QLabel("Amplitude / V"), line_edit_amplitude)
-            line_edit_offset = DelayedDoubleSpinBox()
-            line_edit_offset.setDecimals(3)
-            line_edit_offset.setRange(-5, 5)
-            line_edit_offset.setValue(self._device.get_offset(channel))
-            line_edit_offset.textChanged.connect(lambda: self._device.set_offset(channel, line_edit_offset.value()))  # NOQA
-            layout_new.addRow(QLabel("Offset / V"), line_edit_offset)
-            line_edit_phase = DelayedDoubleSpinBox()
-            line_edit_phase.setDecimals(3)
-            line_edit_phase.setRange(0, 360)
-            line_edit_phase.setValue(self._device.get_phase(channel))
-            line_edit_phase.textChanged.connect(lambda: self._device.set_phase(channel, line_edit_phase.value()))  # NOQA
-            layout_new.addRow(QLabel("Phase / °"), line_edit_phase)
-            line_edit_width = DelayedDoubleSpinBox()
-            line_edit_width.setDecimals(9)
-            line_edit_width.setRange(5e-9, 1e6)
-            line_edit_width.setValue(self._device.get_pulse_width(channel))
-            line_edit_width.textChanged.connect(lambda: self._device.set_pulse_width(channel, line_edit_width.value()))  # NOQA
-            layout_new.addRow(QLabel("Width / s"), line_edit_width)
-            line_edit_lead_edge = DelayedDoubleSpinBox()
-            line_edit_lead_edge.setDecimals(9)
-            line_edit_lead_edge.setRange(3e-9, 1e6)
-            line_edit_lead_edge.setValue(self._device.get_pulse_lead_edge(channel))
-            line_edit_lead_edge.textChanged.connect(  # NOQA
-                lambda: self._device.set_pulse_lead_edge(channel, line_edit_lead_edge.value()))
-            layout_new.addRow(QLabel("Lead Edge / s"), line_edit_lead_edge)
-            line_edit_trail_edge = DelayedDoubleSpinBox()
-            line_edit_trail_edge.setDecimals(9)
-            line_edit_trail_edge.setRange(3e-9, 1e6)
-            line_edit_trail_edge.setValue(self._device.get_pulse_trail_edge(channel))
-            line_edit_trail_edge.textChanged.connect(  # NOQA
-                lambda: self._device.set_pulse_trail_edge(channel, line_edit_trail_edge.value()))
-            layout_new.addRow(QLabel("Trail Edge / s"), line_edit_trail_edge)
-
-        elif waveform == "PRBS":
-            layout_new.addRow(QLabel("Not Implemented"))
-
-        elif waveform == "NOIS":
-            layout_new.addRow(QLabel("Not Implemented"))
-
-        elif waveform == "ARB":
-            layout_new.addRow(QLabel("Not Implemented"))
-
-        elif waveform == "DC":
-            line_edit_offset = DelayedDoubleSpinBox()
-            line_edit_offset.setDecimals(4)
-            line_edit_offset.setRange(-5, 5)
-            line_edit_offset.setValue(self._device.get_offset(channel))
-            line_edit_offset.textChanged.connect(  # NOQA
-                lambda: self._device.set_offset(channel, offset=line_edit_offset.value()))
-            layout_new.addRow(QLabel("Offset / V"), line_edit_offset)
-
-        # Replace old Widget
-        if channel == 1:
-            self._layout_ch1.replaceWidget(self._widget_form_ch1, widget_new)
-            self._widget_form_ch1.hide()
-            self._widget_form_ch1.destroy()
-            self._widget_form_ch1 = widget_new
+        # The Waveform is recorded as current only after it was set, so a failed Write is retried on the next Change
+        requested = self._requested_waveform[channel]
+        if waveform == (self._current_waveform[channel] if requested is None else requested):
+            return
+        self._requested_waveform[channel] = waveform
+
+        # The Waveform is set and its Parameters are read on the Worker Thread, the Form is shown when they are ready
+        names = [row[3] for row in self._FORM_PARAMETERS.get(waveform, [])]
+        future = self._executor.submit(self._apply_waveform, channel, waveform, names)
+        future.add_done_callback(self._log_write_error)
+
+    def _apply_waveform(self, channel, waveform, names):
+        """
+        Set Waveform and read all Parameters of its Form in one Query. Runs on the Worker Thread.
+        :param int channel: Channel Number
+        :param str waveform: Waveform
+        :param list names: Parameter Names of the Form
+        """
+        try:
+            self._device.set_function(channel, function=waveform)
+            values = self._device.get_parameters(channel, names)
+        except Exception:
+            self._waveform_failed.emit(channel, waveform)    # NOQA
+            raise
+        self._parameters_ready.emit(channel, waveform, values)    # NOQA
+
+    @pyqtSlot(int, str)
+    def _handle_waveform_failed(self, channel, waveform):
+        """
+        Forget the requested Waveform, so selecting it again retries the Write
+        :param int channel: Channel Number
+        :param str waveform: Waveform
+        """
+        if self._requested_waveform[channel] == waveform:
+            self._requested_waveform[channel] = None
+
+    @pyqtSlot(int, str, list)
+    def _handle_parameters_ready(self, channel, waveform, values):
+        """
+        Show Parameter Form of Waveform filled with the Values read from the Device
+        :param int channel: Channel Number
+        :param str waveform: Waveform
+        :param list values: Parameter Values in the Order of the Form Rows
+        """
+        if waveform != self._requested_waveform[channel]:
+            # Another Waveform was selected while the Parameters were read
+            return
+        self._requested_waveform[channel] = None
+        self._current_waveform[channel] = waveform
+        rows = self._FORM_PARAMETERS.get(waveform, [])
+        stacked_widget = self._widget_form_ch1 if channel == 1 else self._widget_form_ch2
+
+        forms = self._forms[channel]
+        if waveform in forms:
+            # Refresh cached Form, Parameters may have changed on the Device since it was shown last
+            widget, spin_boxes = forms[waveform]
+            for spin_box, value in zip(spin_boxes, values):
+                with QSignalBlocker(spin_box):
+                    spin_box.setValue(value)
         else:
-            self._layout_ch2.replaceWidget(self._widget_form_ch2, widget_new)
-            self._widget_form_ch2.hide()
-            self._widget_form_ch2.destroy()
-            self._widget_form_ch2 = widget_new
+            # Create Layout depending on selected Waveform
+            widget = QWidget()
+            layout = QFormLayout()
+            widget.setLayout(layout)
+            spin_boxes = [
+                self._add_parameter_row(layout, channel, label, decimals, value_range, name, value)
+                for (label, decimals, value_range, name), value in zip(rows, values)
+            ]
+            if not rows:
+                layout.addRow(QLabel("Not Implemented"))
+            forms[waveform] = (widget, spin_boxes)
+            stacked_widget.addWidget(widget)
+
+        stacked_widget.setCurrentWidget(widget)
+
+    def _add_parameter_row(self, layout, channel, label, decimals, value_range, name, value):
+        """
+        Add Spin Box Row for a numeric Device Parameter to Form Layout
+        :param QFormLayout layout: Form Layout
+        :param int channel: Channel Number
+        :param str label: Row Label
+        :param int decimals: Decimals of Spin Box
+        :param tuple value_range: Minimum and Maximum of Spin Box
+        :param str name: Parameter Name, the Device has to implement 'set_{name}'
+        :param float value: Initial Value
+        :return DelayedDoubleSpinBox: Spin Box of the Row
+        """
+        spin_box = DelayedDoubleSpinBox()
+        spin_box.setDecimals(decimals)
+        spin_box.setRange(*value_range)
+        # The Spin Box starts its Delay Timer on every Value Change, block it so the initial Value is not written back
+        with QSignalBlocker(spin_box):
+            spin_box.setValue(value)
+        # The Setter and Channel are bound once, the Slot only adds the new Value
+        slot = partial(self._write_async, getattr(self._device, f"set_{name}"), channel)
+        spin_box.delayedValueChanged.connect(slot, Qt.ConnectionType.DirectConnection)  # NOQA
+        layout.addRow(QLabel(label), spin_box)
+        return spin_box
+
+    def _write_async(self, setter, *args, **kwargs):
+        """
+        Run Device Setter on the Worker Thread.
+        If the same Setter of the same Channel is still waiting, only its Arguments are replaced,
+        so a Value that is already outdated is never written.
+        :param setter: Device Method, the Channel is its first Argument or the Keyword 'channel'
+        """
+        key = (setter.__name__, kwargs.get("channel", args[0] if args else None))
+        with self._pending_writes_lock:
+            waiting = key in self._pending_writes
+            self._pending_writes[key] = (setter, args, kwargs)
+        if not waiting:
+            future = self._executor.submit(self._run_pending_write, key)
+            future.add_done_callback(self._log_write_error)
+
+    def _run_pending_write(self, key):
+        """
+        Run newest waiting Setter on the Worker Thread
+        :param tuple key: Setter Name and Channel
+        """
+        with self._pending_writes_lock:
+            setter, args, kwargs = self._pending_writes.pop(key)
+        setter(*args, **kwargs)
+
+    def _log_write_error(self, future):
+        """
+        Log Error of a Device Setter that was run on the Worker Thread
+        :param concurrent.futures.Future future: Finished Setter
+        """
+        err = future.exception()
+        if err is not None:
+            logging.error(f"{self._device.name}: Could not apply Setting. Error: '{err}'.")
 
-    @pyqtSlot()
-    def _update_error_label(self):
+    @pyqtSlot(object, str)
+    def _handle_device_error(self, device, err):
         """
-        Update Error in Status Bar
+        Update Error in Status Bar if it belongs to the Device of this Window
         """
-        err = self._device.get_error()
-        if err is not None:
-            self._last_error = err
-            self._status_bar_label.setText(f"\u26A0 Device Error: '{self._last_error}'")
+        if device is self._device:
+            self._update_error_label(err)
+
+    @pyqtSlot(str)
+    def _update_error_label(self, err):
+        """
+        Update Error in Status Bar, the Label is only repainted if the Error changed
+        """
+        if err == self._last_error:
+            return
+        self._last_error = err
+        self._status_bar_label.setText(f"\u26A0 Device Error: '{self._last_error}'")
 
     @pyqtSlot()
     def closeEvent(self, event):
         """
-        Stop Timer when Window is closed
+        Stop Error Polling and wait for Worker Threads when Window is closed
         """
-        if hasattr(self, "_timer"):
-            self._timer.stop()
+        if self._error_poller is not None:
+            self._error_poller.unregister(self._device)
+            self._error_poller.error_occurred.disconnect(self._handle_device_error)  # NOQA
+        if self._state_reader is not None:
+            self._state_reader.wait()
+        self._executor.shutdown(wait=True)
         event.accept()
@@ -3,19 +3,25 @@ Andor Camera
 """
 
 import os
+import time
 import ctypes
 import logging
 import platform
+import itertools
+import threading
 import datetime
 import numpy as np
 import pyqtgraph as pg
 
-from PyQt6.QtCore import Qt, QEvent, pyqtSlot, QTimer
+from PyQt6.QtCore import Qt, QEvent, pyqtSlot, pyqtSignal, QObject, QThread, QTimer
 from PyQt6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget, QPushButton, QLabel, QFormLayout, QComboBox
 
 from src.devices.main_device import Device
+from src.static_gui_elements.toggle_button import ToggleButton
 from src.static_gui_elements.delayed_spin_box import DelayedDoubleSpinBox
 
+_C_INT_P = ctypes.POINTER(ctypes.c_int)
+
 
 class CameraAndor(Device):
     NAME = "Andor Camera"
@@ -62,6 +68,47 @@ class CameraAndor(Device):
         20991: "DRV_NOT_SUPPORTED",
         20992: "DRV_NOT_AVAILABLE"
     }
+    # Status Names indexed by Status Code - 20000, so the Lookup on every Driver Call does not need to hash the Code
+    _STATUS_NAMES = tuple(map(STATUS_CODES.get, range(20000, 21000), itertools.repeat("UNKNOWN")))
+
+    # Argument Types of the Driver Functions, they are declared once in connect() so ctypes does not have to infer
+    # them on every Call. Functions that are missing here are called without declared Types.
+    DRIVER_PROTOTYPES = {
+        "GetAvailableCameras": [_C_INT_P],
+        "GetCameraHandle": [ctypes.c_int, _C_INT_P],
+        "GetCameraSerialNumber": [_C_INT_P],
+        "GetStatus": [_C_INT_P],
+        "GetDetector": [_C_INT_P, _C_INT_P],
+        "SetShutter": [ctypes.c_int] * 4,
+        "SetImage": [ctypes.c_int] * 6,
+        "SetReadMode": [ctypes.c_int],
+        "SetAcquisitionMode": [ctypes.c_int],
+        "SetNumberAccumulations": [ctypes.c_int],
+        "SetAccumulationCycleTime": [ctypes.c_float],
+        "StartAcquisition": [],
+        "WaitForAcquisition": [],
+        "AbortAcquisition": [],
+        "GetAcquiredData": [ctypes.POINTER(ctypes.c_int32), ctypes.c_ulong],
+        "SetTriggerMode": [ctypes.c_int],
+        "SetPreAmpGain": [ctypes.c_int],
+        "SetEMGainMode": [ctypes.c_int],
+        "SetVSSpeed": [ctypes.c_int],
+        "SetBaselineClamp": [ctypes.c_int],
+        "SetExposureTime": [ctypes.c_float],
+        "GetEMCCDGain": [_C_INT_P],
+        "SetEMCCDGain": [ctypes.c_int],
+        "GetEMGainRange": [_C_INT_P, _C_INT_P],
+        "CoolerON": [],
+        "SetCoolerMode": [ctypes.c_int],
+        "SetFanMode": [ctypes.c_int],
+        "IsCoolerOn": [_C_INT_P],
+        "GetTemperature": [_C_INT_P],
+        "SetTemperature": [ctypes.c_int],
+        "ShutDown": [],
+    }
+
+    # Camera Handle by Serial Number of Cameras that were connected before in this Session
+    _known_handles: dict[int, int] = {}
 
     def __init__(self, address=6924):
         # Variables
@@ -83,6 +130,10 @@ class CameraAndor(Device):
         self._acquisition_mode = 1
         self._exposure_time = 0.1
         self._emccd_gain = 1
+        # Serializes Driver Calls, the Camera is used by the Worker Thread of the Window and by the GUI Thread
+        self._lock = threading.RLock()
+        # Arguments of the last successful Setter Calls by Driver Function, Setters with unchanged Arguments are skipped
+        self._sent_settings = {}
 
         self.connect()
 
@@ -102,17 +153,29 @@ class CameraAndor(Device):
             raise ConnectionError("Unsupported Operating System. Windows or Linux required.")
         logging.debug(f"{self.NAME}: Found Driver '{dll_path}', for '{platform.system(), platform.architecture()[0]}'")
         self._ser = ctypes.CDLL(dll_path)
-
-        # Search for Camera with correct Serial Number
+        self._sent_settings.clear()
+        for function_name, argtypes in self.DRIVER_PROTOTYPES.items():
+            function = getattr(self._ser, function_name)
+            function.argtypes = argtypes
+            function.restype = ctypes.c_uint
+
+        # Search for Camera with correct Serial Number.
+        # The Serial Number can only be read after the slow Initialize, so the Handle that matched last time is tried
+        # first and the Search stops at the first Match.
         n_cams = self.get_available_cameras()
         logging.debug(f"{self.NAME}: Found {n_cams} Cameras, searching for correct serial number...")
-        for i in range(n_cams):
-            handle = self.get_handle(camera=i)
+        handles = [self.get_handle(camera=i) for i in range(n_cams)]
+        known_handle = self._known_handles.get(self.address)
+        if known_handle in handles:
+            handles.remove(known_handle)
+            handles.insert(0, known_handle)
+        for handle in handles:
             self.set_handle(handle)
             self.initialize()
             serial = self.get_identification()
-            logging.debug(f"{self.NAME}: Camera {i}: Handle {handle}, Serial Number {serial}")
+            logging.debug(f"{self.NAME}: Handle {handle}, Serial Number {serial}")
             if serial == self.address:
+                CameraAndor._known_handles[self.address] = handle
                 break
 
         # Check Status
@@ -147,9 +210,10 @@ class CameraAndor(Device):
         """
         Disconnect from Camera
         """
-        # save_settings(path=self.save_file_path, settings=self.get_settings())
-        status = self._ser.ShutDown()
-        logging.info(f"{self.NAME}: Send ShutDown(), Status: {self.STATUS_CODES[status]}.")
+        with self._lock:
+            # save_settings(path=self.save_file_path, settings=self.get_settings())
+            status = self._ser.ShutDown()
+            logging.info(f"{self.NAME}: Send ShutDown(), Status: {self._status_name(status)}.")
 
     def get_settings(self):
         """
@@ -172,139 +236,235 @@ class CameraAndor(Device):
         """
         Get Number of Available Cameras
         """
-        n_cams = ctypes.c_int()
-        status = self._ser.GetAvailableCameras(ctypes.byref(n_cams))
-        logging.info(f"{self.NAME}: Recv: GetAvailableCameras({n_cams.value}), Status: {self.STATUS_CODES[status]}")
-        return n_cams.value
+        with self._lock:
+            n_cams = ctypes.c_int()
+            status = self._ser.GetAvailableCameras(ctypes.byref(n_cams))
+            logging.info(f"{self.NAME}: Recv: GetAvailableCameras({n_cams.value}), Status: {self._status_name(status)}")
+            return n_cams.value
 
     def get_handle(self, camera):
         """
         Get Handle Number of Camera
         """
-        handle = ctypes.c_int()
-        status = self._ser.GetCameraHandle(camera, ctypes.byref(handle))
-        logging.info(f"{self.NAME}: Recv: GetCameraHandle({handle.value}), Status: {self.STATUS_CODES[status]}")
-        return handle.value
+        with self._lock:
+            handle = ctypes.c_int()
+            status = self._ser.GetCameraHandle(camera, ctypes.byref(handle))
+            logging.info(f"{self.NAME}: Recv: GetCameraHandle({handle.value}), Status: {self._status_name(status)}")
+            return handle.value
 
     def set_handle(self, handle):
         """
         Set Handle Number
         """
-        status = self._ser.SetCurrentCamera(ctypes.c_double(handle))
-        logging.info(f"{self.NAME}: Send: SetCurrentCamera({handle}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetCurrentCamera(ctypes.c_double(handle))
+            logging.info(f"{self.NAME}: Send: SetCurrentCamera({handle}), Status: {self._status_name(status)}")
 
     def initialize(self):
         """
         Initialize Camera
         """
-        status = self._ser.Initialize(ctypes.c_char())
-        logging.info(f"{self.NAME}: Send: Initialize(), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.Initialize(ctypes.c_char())
+            logging.info(f"{self.NAME}: Send: Initialize(), Status: {self._status_name(status)}")
 
     def get_identification(self):
         """
         Get Serial Number
         """
-        serial = ctypes.c_int()
-        status = self._ser.GetCameraSerialNumber(ctypes.byref(serial))
-        logging.info(f"{self.NAME}: Recv: GetIdentification({serial.value}), Status: {self.STATUS_CODES[status]}")
-        return serial.value
+        with self._lock:
+            serial = ctypes.c_int()
+            status = self._ser.GetCameraSerialNumber(ctypes.byref(serial))
+            logging.info(f"{self.NAME}: Recv: GetIdentification({serial.value}), Status: {self._status_name(status)}")
+            return serial.value
 
     def get_last_error(self):
         """
         Get Last Error
         """
-        status = ctypes.c_int()
-        error = self._ser.GetStatus(ctypes.byref(status))
-        logging.info(f"{self.NAME}: Recv: GetStatus({status.value}), Status: {self.STATUS_CODES[error]}")
-        return self.STATUS_CODES[error]
+        with self._lock:
+            status = ctypes.c_int()
+            error = self._ser.GetStatus(ctypes.byref(status))
+            logging.info(f"{self.NAME}: Recv: GetStatus({status.value}), Status: {self._status_name(error)}")
+            return self._status_name(error)
 
     def get_detector(self):
         """
         Get Width and Height of Detector
         """
-        width = ctypes.c_int()
-        height = ctypes.c_int()
-        status = self._ser.GetDetector(ctypes.byref(width), ctypes.byref(height))
-        logging.info(f"{self.NAME}: Recv: GetStatus({width.value}, {height.value}), "
-                     f"Status: {self.STATUS_CODES[status]}")
-        self._image_width, self._image_height = width.value, height.value
-        self.resize_dimensions = [0, self._image_width, 0, self._image_height]
+        with self._lock:
+            width = ctypes.c_int()
+            height = ctypes.c_int()
+            status = self._ser.GetDetector(ctypes.byref(width), ctypes.byref(height))
+            logging.info(f"{self.NAME}: Recv: GetStatus({width.value}, {height.value}), "
+                         f"Status: {self._status_name(status)}")
+            self._image_width, self._image_height = width.value, height.value
+            self.resize_dimensions = [0, self._image_width, 0, self._image_height]
+
+            return self._image_width, self._image_height
+
+    def _status_name(self, status):
+        """
+        Get Name of Driver Status Code
+        :param int status: Status Code
+        :return str: Name, 'UNKNOWN' for Codes the Driver does not document
+        """
+        if 20000 <= status < 21000:
+            return self._STATUS_NAMES[status - 20000]
+        return "UNKNOWN"
 
-        return self._image_width, self._image_height
+    def _is_sent(self, function_name, *args):
+        """
+        Check if Driver Function was already called successfully with the same Arguments
+        :param str function_name: Driver Function
+        :param args: Arguments
+        :return bool: True if the Call can be skipped
+        """
+        return self._sent_settings.get(function_name) == args
+
+    def _set_sent(self, status, function_name, *args):
+        """
+        Remember Arguments of a Driver Function Call if it was successful
+        :param int status: Status Code returned by the Call
+        :param str function_name: Driver Function
+        :param args: Arguments
+        """
+        if self._status_name(status) == "DRV_SUCCESS":
+            self._sent_settings[function_name] = args
+        else:
+            self._sent_settings.pop(function_name, None)
 
     def set_shutter(self, typ, mode, closing_time, opening_time):
         """
         Set Shutter Settings
         """
-        status = self._ser.SetShutter(typ, mode, closing_time, opening_time)
-        logging.info(f"{self.NAME}: Send: SetShutter({typ}, {mode}, {closing_time}, {opening_time}), "
-                     f"Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            if self._is_sent("SetShutter", typ, mode, closing_time, opening_time):
+                return
+            status = self._ser.SetShutter(typ, mode, closing_time, opening_time)
+            self._set_sent(status, "SetShutter", typ, mode, closing_time, opening_time)
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(f"{self.NAME}: Send: SetShutter({typ}, {mode}, {closing_time}, {opening_time}), "
+                             f"Status: {self._status_name(status)}")
 
     def set_image(self, h_bin=1, v_bin=1, h_start=1, h_end=1, v_start=1, v_end=1):
         """
         Set Image Settings
         """
-        self._ser.SetImage(h_bin, v_bin, h_start, h_end, v_start, v_end)
+        with self._lock:
+            if self._is_sent("SetImage", h_bin, v_bin, h_start, h_end, v_start, v_end):
+                return
+            status = self._ser.SetImage(h_bin, v_bin, h_start, h_end, v_start, v_end)
+            self._set_sent(status, "SetImage", h_bin, v_bin, h_start, h_end, v_start, v_end)
 
     def set_read_mode(self, mode=4):
         """
         Set Read Mode 0 Full vertical binning | 1 Multitrack | 2 random track | 3 single track | 4 image
         """
-        self._ser.SetReadMode(mode)
-        self._read_mode = mode
+        with self._lock:
+            self._read_mode = mode
+            if self._is_sent("SetReadMode", mode):
+                return
+            status = self._ser.SetReadMode(mode)
+            self._set_sent(status, "SetReadMode", mode)
 
     def set_acquisition_mode(self, mode=1):
         """
-        Set Acquisition Mode 1 Single Scan | 3 Kinetic Scan
+        Set Acquisition Mode 1 Single Scan | 2 Accumulate | 3 Kinetic Scan
+        """
+        with self._lock:
+            self._acquisition_mode = mode
+            if self._is_sent("SetAcquisitionMode", mode):
+                return
+            status = self._ser.SetAcquisitionMode(mode)
+            self._set_sent(status, "SetAcquisitionMode", mode)
+
+    def set_accumulate_mode(self, accumulations, cycle_time=0.0):
+        """
+        Set Acquisition Mode 2 Accumulate, the Driver sums the given Number of Frames into one Image
+        :param int accumulations: Number of Frames
+        :param float cycle_time: Time between Frames in s, the Driver uses the shortest possible Time if it is too short
+        :return bool: True if the Camera accepted the Mode, the Number of Frames and the Cycle Time
+        """
+        with self._lock:
+            status = self._ser.SetAcquisitionMode(2)
+            self._set_sent(status, "SetAcquisitionMode", 2)
+            logging.info(f"{self.NAME}: Send: SetAcquisitionMode(2), Status: {self._status_name(status)}")
+            if self._status_name(status) != "DRV_SUCCESS":
+                return False
+            self._acquisition_mode = 2
+            # On Failure the Camera goes back to Single Scan, so the Fallback does not sum with a wrong Number of Frames
+            status = self._ser.SetNumberAccumulations(accumulations)
+            logging.info(f"{self.NAME}: Send: SetNumberAccumulations({accumulations}), "
+                         f"Status: {self._status_name(status)}")
+            if self._status_name(status) != "DRV_SUCCESS":
+                self.set_acquisition_mode(1)
+                return False
+            status = self._ser.SetAccumulationCycleTime(ctypes.c_float(cycle_time))
+            logging.info(f"{self.NAME}: Send: SetAccumulationCycleTime({cycle_time}), "
+                         f"Status: {self._status_name(status)}")
+            if self._status_name(status) != "DRV_SUCCESS":
+                self.set_acquisition_mode(1)
+                return False
+            return True
+
+    def start_acquisition(self, wait=True):
+        """
+        Start Acquisition Mode
+        :param bool wait: Wait until the Acquisition is done
         """
-        self._ser.SetAcquisitionMode(mode)
-        self._acquisition_mode = mode
+        with self._lock:
+            self._ser.StartAcquisition()
+            if wait:
+                self.wait_for_acquisition()
 
-    def start_acquisition(self):
+    def wait_for_acquisition(self):
         """
-        Start Acquisition Mode
+        Wait until the running Acquisition is done
         """
-        self._ser.StartAcquisition()
-        self._ser.WaitForAcquisition()
+        with self._lock:
+            self._ser.WaitForAcquisition()
 
     def stop_acquisition(self):
         """
         Stop Acquisition Mode
         """
-        self._ser.AbortAcquisition()
+        with self._lock:
+            self._ser.AbortAcquisition()
 
-    def get_acquired_data(self, image_array=None):
+    def get_acquired_data(self, out=None):
         """
         Get last Image
-        """
-        if image_array is None:
-            image_array = []
-
-        # Get Number of Pixels
-        if (self._read_mode, self._acquisition_mode) == (4, 1):
-            n_pixel = self._image_width * self._image_height / self._image_height_bin_size / self._image_width_bin_size
-        elif (self._read_mode, self._acquisition_mode) == (4, 3):
-            n_pixel = self._image_width * self._image_height / self._image_height_bin_size / \
-                      self._image_width_bin_size * self._scans
-        elif (self._read_mode, self._acquisition_mode) in [(0, 1), (3, 1)]:
-            n_pixel = self._image_width
-        elif (self._read_mode, self._acquisition_mode) in [(0, 3), (3, 3)]:
-            n_pixel = self._image_width * self._scans
-        else:
-            logging.warning(f"{self.NAME}: Could not get data: ReadMode or AcquisitionMode not set correctly")
-            return
-
-        n_pixel = int(n_pixel)
-        ctypes_image_array = ctypes.c_int * n_pixel
-        ctypes_image = ctypes_image_array()
-
-        # Get Image
-        self._ser.GetAcquiredData(ctypes.pointer(ctypes_image), ctypes.c_ulong(n_pixel))
-
-        for i in range(len(ctypes_image)):
-            image_array.append(ctypes_image[i])
-
-        return image_array[:]
+        :param np.ndarray out: int32 Array the Image is written to, a new one is allocated if it is None or its Size
+            does not match
+        :return np.ndarray: Pixel Values as flat int32 Array
+        """
+        with self._lock:
+            # Get Number of Pixels
+            if (self._read_mode, self._acquisition_mode) in [(4, 1), (4, 2)]:
+                n_pixel = self._image_width * self._image_height / self._image_height_bin_size / \
+                          self._image_width_bin_size
+            elif (self._read_mode, self._acquisition_mode) == (4, 3):
+                n_pixel = self._image_width * self._image_height / self._image_height_bin_size / \
+                          self._image_width_bin_size * self._scans
+            elif (self._read_mode, self._acquisition_mode) in [(0, 1), (3, 1)]:
+                n_pixel = self._image_width
+            elif (self._read_mode, self._acquisition_mode) in [(0, 3), (3, 3)]:
+                n_pixel = self._image_width * self._scans
+            else:
+                logging.warning(f"{self.NAME}: Could not get data: ReadMode or AcquisitionMode not set correctly")
+                return
+
+            n_pixel = int(n_pixel)
+            if out is not None and out.size == n_pixel and out.dtype == np.int32:
+                image = out
+            else:
+                image = np.empty(n_pixel, dtype=np.int32)
+
+            # Get Image, the Driver writes directly into the Memory of the numpy Array
+            self._ser.GetAcquiredData(image.ctypes.data_as(ctypes.POINTER(ctypes.c_int32)), ctypes.c_ulong(n_pixel))
+
+            return image
 
     def save_picture(self, file_name: str):
         """
@@ -322,44 +482,55 @@ class CameraAndor(Device):
         """
         Set Trigger Mode
         """
-        status = self._ser.SetTriggerMode(trigger_mode)
-        logging.info(f"{self.NAME}: Send: SetTriggerMode({trigger_mode}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetTriggerMode(trigger_mode)
+            logging.info(f"{self.NAME}: Send: SetTriggerMode({trigger_mode}), Status: {self._status_name(status)}")
 
     def set_preamp_gain(self, preamp_gain):
         """
         Set PreAmp Gain
         """
-        status = self._ser.SetPreAmpGain(preamp_gain)
-        logging.info(f"{self.NAME}: Send: SetPreAmpGain({preamp_gain}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetPreAmpGain(preamp_gain)
+            logging.info(f"{self.NAME}: Send: SetPreAmpGain({preamp_gain}), Status: {self._status_name(status)}")
 
     def set_em_gain_mode(self, em_gain_mode):
         """
         Set EM Gain Mode
         """
-        status = self._ser.SetEMGainMode(em_gain_mode)
-        logging.info(f"{self.NAME}: Send: SetEMGainMode({em_gain_mode}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetEMGainMode(em_gain_mode)
+            logging.info(f"{self.NAME}: Send: SetEMGainMode({em_gain_mode}), Status: {self._status_name(status)}")
 
     def set_vs_speed(self, vs_speed):
         """
         Set VS Speed
         """
-        status = self._ser.SetVSSpeed(vs_speed)
-        logging.info(f"{self.NAME}: Send: SetVSSpeed({vs_speed}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetVSSpeed(vs_speed)
+            logging.info(f"{self.NAME}: Send: SetVSSpeed({vs_speed}), Status: {self._status_name(status)}")
 
     def set_baseline_clamp(self, baseline_clamp):
         """
         Set Baseline Clamp
         """
-        status = self._ser.SetBaselineClamp(baseline_clamp)
-        logging.info(f"{self.NAME}: Send: SetBaselineClamp({baseline_clamp}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetBaselineClamp(baseline_clamp)
+            logging.info(f"{self.NAME}: Send: SetBaselineClamp({baseline_clamp}), Status: {self._status_name(status)}")
 
     def set_exposure_time(self, exposure_time):
         """
         Set Exposure Time
         """
-        status = self._ser.SetExposureTime(ctypes.c_float(exposure_time))
-        self._exposure_time = exposure_time
-        logging.info(f"{self.NAME}: Send: SetExposureTime({exposure_time}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            self._exposure_time = exposure_time
+            if self._is_sent("SetExposureTime", exposure_time):
+                return
+            status = self._ser.SetExposureTime(ctypes.c_float(exposure_time))
+            self._set_sent(status, "SetExposureTime", exposure_time)
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(f"{self.NAME}: Send: SetExposureTime({exposure_time}), "
+                             f"Status: {self._status_name(status)}")
 
     def get_exposure_time(self):
         """
@@ -371,66 +542,78 @@ class CameraAndor(Device):
         """
         Set EMCCD Gain Mode
         """
-        status = self._ser.SetEMCCDGainMode(gain_mode)
-        logging.info(f"{self.NAME}: Send: SetGainMode({gain_mode}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetEMCCDGainMode(gain_mode)
+            logging.info(f"{self.NAME}: Send: SetGainMode({gain_mode}), Status: {self._status_name(status)}")
 
     def get_emccd_gain(self):
         """
         Get EMCCD Gain
         """
-        gain = ctypes.c_int()
-        status = self._ser.GetEMCCDGain(ctypes.byref(gain))
-        self._emccd_gain = gain.value
-        logging.info(f"{self.NAME}: Recv: GetEMCCDGain({gain.value}), Status: {self.STATUS_CODES[status]}")
-        return gain.value
+        with self._lock:
+            gain = ctypes.c_int()
+            status = self._ser.GetEMCCDGain(ctypes.byref(gain))
+            self._emccd_gain = gain.value
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(f"{self.NAME}: Recv: GetEMCCDGain({gain.value}), Status: {self._status_name(status)}")
+            return gain.value
 
     def set_emccd_gain(self, gain):
         """
         Set EMCCD Gain
         """
-        status = self._ser.SetEMCCDGain(gain)
-        self._emccd_gain = gain
-        logging.info(f"{self.NAME}: Send: SetEMCCDGain({gain}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            self._emccd_gain = gain
+            if self._is_sent("SetEMCCDGain", gain):
+                return
+            status = self._ser.SetEMCCDGain(gain)
+            self._set_sent(status, "SetEMCCDGain", gain)
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(f"{self.NAME}: Send: SetEMCCDGain({gain}), Status: {self._status_name(status)}")
 
     def get_emccd_gain_range(self):
         """
         Get EMCCD Gain Range
         """
-        lowest = ctypes.c_int()
-        highest = ctypes.c_int()
-        status = self._ser.GetEMGainRange(ctypes.byref(lowest), ctypes.byref(highest))
-        self._gain_range = lowest.value, highest.value
-        logging.info(f"{self.NAME}: Recv: GetEMGainRange({self._gain_range}), Status: {self.STATUS_CODES[status]}")
-        return self._gain_range
+        with self._lock:
+            lowest = ctypes.c_int()
+            highest = ctypes.c_int()
+            status = self._ser.GetEMGainRange(ctypes.byref(lowest), ctypes.byref(highest))
+            self._gain_range = lowest.value, highest.value
+            logging.info(f"{self.NAME}: Recv: GetEMGainRange({self._gain_range}), Status: {self._status_name(status)}")
+            return self._gain_range
 
     def set_cooler_on(self):
         """
         Turn Cooler On
         """
-        status = self._ser.CoolerON()
-        logging.info(f"{self.NAME}: Send: CoolerON(), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.CoolerON()
+            logging.info(f"{self.NAME}: Send: CoolerON(), Status: {self._status_name(status)}")
 
     def set_cooler_mode(self, mode):
         """
         Set Cooler Mode 0 Off | 1 On
         """
-        status = self._ser.SetCoolerMode(mode)
-        logging.info(f"{self.NAME}: Send: SetCoolerMode({mode}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            status = self._ser.SetCoolerMode(mode)
+            logging.info(f"{self.NAME}: Send: SetCoolerMode({mode}), Status: {self._status_name(status)}")
 
     def set_fan_mode(self, mode):
         """
         Set Fan Mode 0 Full | 1 Low | 2 Off
         """
-        if mode == "Full":
-            status = self._ser.SetFanMode(0)
-        elif mode == "Low":
-            status = self._ser.SetFanMode(1)
-        elif mode == "Off":
-            status = self._ser.SetFanMode(2)
-        else:
-            raise ValueError("Fan Mode has to be Full, Low or Off")
-        self._fan_mode = mode
-        logging.info(f"{self.NAME}: Send: SetFanMode({mode}), Status: {self.STATUS_CODES[status]}")
+        with self._lock:
+            if mode == "Full":
+                status = self._ser.SetFanMode(0)
+            elif mode == "Low":
+                status = self._ser.SetFanMode(1)
+            elif mode == "Off":
+                status = self._ser.SetFanMode(2)
+            else:
+                raise ValueError("Fan Mode has to be Full, Low or Off")
+            self._fan_mode = mode
+            logging.info(f"{self.NAME}: Send: SetFanMode({mode}), Status: {self._status_name(status)}")
 
     def get_fan_mode(self):
         """
@@ -442,25 +625,28 @@ class CameraAndor(Device):
         """
         Get Cooler Status
         """
-        cooler_status = ctypes.c_int()
-        status = self._ser.IsCoolerOn(ctypes.byref(cooler_status))
-        logging.info(f"{self.NAME}: Recv: IsCoolerOn({cooler_status.value}), Status: {self.STATUS_CODES[status]}")
-        return cooler_status.value
+        with self._lock:
+            cooler_status = ctypes.c_int()
+            status = self._ser.IsCoolerOn(ctypes.byref(cooler_status))
+            logging.info(f"{self.NAME}: Recv: IsCoolerOn({cooler_status.value}), Status: {self._status_name(status)}")
+            return cooler_status.value
 
     def get_temperature(self):
         """
         Get Current Temperature in °C
         """
-        temperature = ctypes.c_int()
-        self._ser.GetTemperature(ctypes.byref(temperature))
-        return temperature.value
+        with self._lock:
+            temperature = ctypes.c_int()
+            self._ser.GetTemperature(ctypes.byref(temperature))
+            return temperature.value
 
     def set_target_temperature(self, temperature):
         """
         Set Desired Temperature in °C
         """
-        self._ser.SetTemperature(temperature)
-        self._target_temperature = temperature
+        with self._lock:
+            self._ser.SetTemperature(temperature)
+            self._target_temperature = temperature
 
     def get_target_temperature(self):
         """
@@ -473,54 +659,172 @@ class CameraAndor(Device):
         """
         Take Picture
         """
-        # TODO: fix gain setting
-        if exposure_time is None:
-            exposure_time = self._exposure_time
-        if emccd_gain is None:
-            emccd_gain = self._emccd_gain
-        if dimensions is None:
-            dimensions = self.resize_dimensions
+        with self._lock:
+            # TODO: fix gain setting
+            if exposure_time is None:
+                exposure_time = self._exposure_time
+            if emccd_gain is None:
+                emccd_gain = self._emccd_gain
+            if dimensions is None:
+                dimensions = self.resize_dimensions
+
+            # Settings, Setters whose Values did not change since the last Picture skip the Driver Call
+            self.set_exposure_time(exposure_time)
+            self.set_emccd_gain(emccd_gain)
+            self.set_image(1, 1, 1, self._image_width, 1, self._image_height)
+            self.set_acquisition_mode(1)
+            self.set_read_mode(4)
+            self.set_shutter(*shutter)
+
+            # Take Picture
+            if accumulations == 1:
+                self.start_acquisition()
+                image = self.get_acquired_data()
+                self.stop_acquisition()
 
-        # Settings
-        self.set_exposure_time(exposure_time)
-        self.set_emccd_gain(emccd_gain)
-        self.set_image(1, 1, 1, self._image_width, 1, self._image_height)
-        self.set_acquisition_mode(1)
-        self.set_read_mode(4)
-        self.set_shutter(*shutter)
-
-        # Take Picture
-        if accumulations == 1:
-            self.start_acquisition()
-            image = np.array(self.get_acquired_data())
-            self.stop_acquisition()
-
-        elif accumulations > 1:
-            image = np.empty((self._image_width*self._image_height))
-            for i in range(int(accumulations)):
+            elif accumulations > 1 and self.set_accumulate_mode(int(accumulations)):
+                # The Driver sums all Frames, so only one Image is read
                 self.start_acquisition()
-                image += np.array(self.get_acquired_data())
+                image = self.get_acquired_data()
                 self.stop_acquisition()
 
-        else:
-            logging.error(f"{self.NAME}: Could not take Picture. '{accumulations}=' has to be >0")
-            return np.zeros((self._image_height, self._image_width))
+            elif accumulations > 1:
+                # Fallback if the Camera rejects Accumulate Mode,
+                # every Frame is read into one Buffer and added to the Sum.
+                # The next Exposure is started before the last Frame is added, so the Camera does not wait for the Sum.
+                image = np.zeros(self._image_width*self._image_height, dtype=np.int64)
+                self.start_acquisition()
+                frame = self.get_acquired_data()
+                for i in range(int(accumulations) - 1):
+                    self.start_acquisition(wait=False)
+                    image += frame
+                    self.wait_for_acquisition()
+                    frame = self.get_acquired_data(out=frame)
+                image += frame
+                self.stop_acquisition()
+
+            else:
+                logging.error(f"{self.NAME}: Could not take Picture. '{accumulations}=' has to be >0")
+                return np.zeros((self._image_height, self._image_width))
 
-        # Reshape, Flip and Resize
-        image = np.reshape(image, (self._image_height, -1))
-        image = np.flip(image, axis=1)
-        image = image - 300 * accumulations
-        if resize:
-            image = image[dimensions[0]:dimensions[1], dimensions[2]:dimensions[3]]
-        self.last_picture = image
+            # Reshape, Flip and Resize are Views, so subtracting the Baseline is the only Pass over the Pixels
+            image = image.reshape(self._image_height, -1)[:, ::-1]
+            if resize:
+                image = image[dimensions[0]:dimensions[1], dimensions[2]:dimensions[3]]
+            image = image - 300 * accumulations
+            self.last_picture = image
 
-        return image
+            return image
 
     def gui_open(self):
         self.app = CameraAndorWindow(self)
 
 
+class CameraAndorWorker(QObject):
+    """
+    Runs the Driver Calls of a CameraAndorWindow on a Worker Thread, so Exposures do not block the GUI
+    """
+
+    temperature_ready = pyqtSignal(int)
+    picture_ready = pyqtSignal(object)
+
+    def __init__(self, device: CameraAndor, interval=2000):
+        """
+        :param CameraAndor device: Camera
+        :param int interval: Time in ms between Temperature Queries
+        """
+        super().__init__()
+        self._device = device
+        self._interval = interval
+        self._timer = None
+        self._live_timer = None     # Single Shot Timer of the next Live Picture, there is at most one pending
+        self._last_temperature = 0.0
+        self._live = False
+        # Set by the Window once it shows the last Picture, Pictures taken before that are dropped
+        self._picture_shown = threading.Event()
+        self._picture_shown.set()
+
+    @pyqtSlot()
+    def start_timer(self):
+        """
+        Create Temperature Timer on the Worker Thread
+        """
+        self._timer = QTimer()
+        self._timer.timeout.connect(self.poll_temperature)    # NOQA
+        self._timer.start(self._interval)
+        self._live_timer = QTimer()
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(0)
+        self._live_timer.timeout.connect(self.take_picture)    # NOQA
+        self.poll_temperature()
+
+    @pyqtSlot()
+    def poll_temperature(self):
+        """
+        Query Temperature
+        """
+        self._last_temperature = time.monotonic()
+        self.temperature_ready.emit(self._device.get_temperature())    # NOQA
+
+    @pyqtSlot()
+    def take_picture(self):
+        """
+        Take Picture with the current Settings.
+        In Live Mode the next Picture is taken right away, so the Camera exposes while the Window shows this one.
+        The Temperature Timer is stopped in Live Mode and the Temperature is queried between Pictures instead.
+        """
+        pic = self._device.take_picture()
+        if self._picture_shown.is_set():
+            self._picture_shown.clear()
+            self.picture_ready.emit(pic)    # NOQA
+        if self._live:
+            if time.monotonic() - self._last_temperature >= self._interval / 1000:
+                self.poll_temperature()
+            # Through the Event Loop, so Settings and Stop Requests are handled between Pictures.
+            # Restarting the one Live Timer keeps a single pending Picture, however often Live is toggled.
+            self._live_timer.start()
+
+    @pyqtSlot(bool)
+    def set_live(self, live):
+        """
+        Start or stop taking Pictures continuously
+        :param bool live: Live Mode
+        """
+        self._live = live
+        if live:
+            self._timer.stop()
+            if not self._live_timer.isActive():
+                self._live_timer.start()
+        else:
+            self._live_timer.stop()
+            self._timer.start(self._interval)
+
+    def picture_shown(self):
+        """
+        Allow the next Picture to be sent to the Window, can be called from any Thread
+        """
+        self._picture_shown.set()
+
+    @pyqtSlot(float, int, str)
+    def apply_settings(self, exposure_time, target_temperature, fan_mode):
+        """
+        Write Settings to Camera
+        :param float exposure_time: Exposure Time
+        :param int target_temperature: Target Temperature in °C
+        :param str fan_mode: Fan Mode Full | Low | Off
+        """
+        self._device.set_exposure_time(exposure_time)
+        self._device.set_target_temperature(target_temperature)
+        self._device.set_fan_mode(fan_mode)
+
+
 class CameraAndorWindow(QWidget):
+
+    # Requests to the Worker, they are queued because the Worker lives on another Thread
+    _picture_requested = pyqtSignal()
+    _live_toggled = pyqtSignal(bool)
+    _settings_applied = pyqtSignal(float, int, str)
+
     def __init__(self, device: CameraAndor):
         super().__init__()
         self.device = device
@@ -544,12 +848,20 @@ class CameraAndorWindow(QWidget):
         self._line_edit_target_temperature = DelayedDoubleSpinBox()
         self._line_edit_target_temperature.setValue(self.device.get_target_temperature())
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._refresh_values)    # NOQA
-        self.timer.start(2000)
-
         self._initialize_widgets()
-        self._refresh_values()
+
+        # All Driver Calls run on the Worker Thread, the Window only shows their Results
+        self._thread = QThread()
+        self._worker = CameraAndorWorker(self.device)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.start_timer)    # NOQA
+        self._worker.temperature_ready.connect(self._handle_temperature_ready)    # NOQA
+        self._worker.picture_ready.connect(self._handle_picture_ready)    # NOQA
+        self._picture_requested.connect(self._worker.take_picture)    # NOQA
+        self._live_toggled.connect(self._worker.set_live)    # NOQA
+        self._settings_applied.connect(self._worker.apply_settings)    # NOQA
+        self._thread.start()
+
         self.show()
 
     def _initialize_widgets(self):
@@ -561,9 +873,12 @@ class CameraAndorWindow(QWidget):
         layout_picture.addWidget(self._cam_pic_canvas)
         button_take_picture = QPushButton("Take Picture")
         button_take_picture.clicked.connect(self._refresh_picture)    # NOQA
+        button_live = ToggleButton(labels=["Stop Live", "Live"])
+        button_live.clicked.connect(self._live_toggled)    # NOQA
         button_save_picture = QPushButton("Save Picture")
         button_save_picture.clicked.connect(self._save_picture)    # NOQA
         layout_picture.addWidget(button_take_picture)
+        layout_picture.addWidget(button_live)
         layout_picture.addWidget(button_save_picture)
         widget_picture.setLayout(layout_picture)
 
@@ -599,21 +914,27 @@ class CameraAndorWindow(QWidget):
 
     @pyqtSlot()
     def _handle_button_apply(self):
-        self.device.set_exposure_time(self._line_edit_exposure_time.text())
-        self.device.set_target_temperature(self._line_edit_target_temperature.text())
-        self.device.set_fan_mode(self._combo_box_cooling_mode.currentText())
+        self._settings_applied.emit(    # NOQA
+            self._line_edit_exposure_time.value(),
+            int(self._line_edit_target_temperature.value()),
+            self._combo_box_cooling_mode.currentText(),
+        )
 
-    @pyqtSlot()
-    def _refresh_values(self):
-        self._label_temperature.setText(str(self.device.get_temperature()))
+    @pyqtSlot(int)
+    def _handle_temperature_ready(self, temperature):
+        self._label_temperature.setText(str(temperature))
 
     @pyqtSlot()
     def _refresh_picture(self):
-        pic = self.device.take_picture()
+        self._picture_requested.emit()    # NOQA
+
+    @pyqtSlot(object)
+    def _handle_picture_ready(self, pic):
         self._cam_pic_canvas.clear()
         self._cam_pic_canvas.setImage(pic)
         self._label_pic_info.setText(f"Max: {np.max(pic)}\nSum: {pic.sum()}")
         # self._label_pic_info.setText(f"Max: {pic.max()}\nSum: {pic.sum()}")
+        self._worker.picture_shown()
 
     @pyqtSlot()
     def _save_picture(self):
@@ -625,5 +946,6 @@ class CameraAndorWindow(QWidget):
         """
         Close Window Event
         """
-        self.timer.stop()
+        self._thread.quit()
+        self._thread.wait()
         event.accept()
@@ -4,6 +4,7 @@ UC480 Thorlabs Camera
 
 import os
 import sys
+import ctypes
 import logging
 import numpy as np
 
@@ -33,46 +34,70 @@ class CameraThorlabs:
         self._ser.Trigger.Set(uc480.Defines.TriggerMode.Software)
         self._ser.Timing.Exposure.Set(100)
 
+        self._width = 0
+        self._height = 0
+        self._bits = 0
+        self._pic_bytes = np.empty(0, dtype=np.uint8)
+
     def disconnect(self):
         self._ser.Exit()
 
     def take_picture(self):
         try:
-            self._ser.Memory.Free(1)                                             # free memory on camera
+            self._allocate()
         except clr.System.NullReferenceException:
             logging.error(f"{self.NAME}: Could not take picture. Camera not initialized")
             return
-        self._ser.Memory.Allocate(True)                                          # reallocate memory on camera
-        _, width, height, bits, _ = self._ser.Memory.Inquire(1, 0, 0, 0, 0)      # ask details of memory
         self._ser.Acquisition.Freeze(uc480.Defines.DeviceParameter.Wait)         # take picture
-        _, pic = self._ser.Memory.CopyToArray(1, bytearray(1))                   # copy image to memory
-
-        pic = np.fromiter(pic, int)                                             # convert bytearray to int
-        pic = np.transpose(pic)
-        pic = pic.reshape((bits // 8, width, height), order='F')                # reshape to matrix
-        pic = pic[0, 0:width, 0:height]
 
-        return pic
+        return self._read_picture()
 
     def start_video(self):
-        self._ser.Memory.Free(1)
-        self._ser.Memory.Allocate(True)
+        self._allocate()
         self._ser.Acquisition.Capture()
 
     def get_video_frame(self):
-        _, width, height, bits, _ = self._ser.Memory.Inquire(1, 0, 0, 0, 0)
-        _, pic = self._ser.Memory.CopyToArray(1, bytearray(1))
-
         try:
-            pic = np.fromiter(pic, int)  # convert bytearray to int
-        except TypeError:
+            return self._read_picture()
+        except (TypeError, ValueError):
             logging.warning(f"{self.NAME}: Could not take picture")
 
-        pic = np.transpose(pic)
-        pic = pic.reshape((bits // 8, width, height), order='F')  # reshape to matrix
-        pic = pic[0, 0:width, 0:height]
-
-        return pic
+    def _allocate(self):
+        """
+        Reallocate Image Memory on the Camera and cache its Size.
+        The Size only changes when the Memory is reallocated, so it is not inquired again for every Frame.
+        """
+        self._ser.Memory.Free(1)                                                 # free memory on camera
+        self._ser.Memory.Allocate(True)                                          # reallocate memory on camera
+        _, self._width, self._height, self._bits, _ = self._ser.Memory.Inquire(1, 0, 0, 0, 0)
+        size = self._width * self._height * (self._bits // 8)
+        if self._pic_bytes.size != size:
+            self._pic_bytes = np.empty(size, dtype=np.uint8)
+
+    def _read_picture(self):
+        """
+        Copy the Image Memory into the persistent Buffer and convert it.
+        The Bytes are copied in one memmove from the Image Memory Pointer,
+        instead of going through a new .NET Array that is converted Element by Element.
+        :return np.ndarray: uint8 Matrix indexed by [x, y], it is a View of the Buffer and overwritten by the next Frame
+        """
+        _, ptr = self._ser.Memory.ToIntPtr(1, clr.System.IntPtr.Zero)
+        ctypes.memmove(self._pic_bytes.ctypes.data, ptr.ToInt64(), self._pic_bytes.nbytes)
+
+        return self._convert_picture(self._pic_bytes, self._width, self._height, self._bits)
+
+    @staticmethod
+    def _convert_picture(pic, width, height, bits):
+        """
+        Convert packed Image Bytes to Matrix of the first Color Channel
+        :param np.ndarray pic: uint8 Image Bytes, Pixels are stored row by row with bits // 8 Bytes each
+        :param int width: Image Width in Pixels
+        :param int height: Image Height in Pixels
+        :param int bits: Bits per Pixel
+        :return np.ndarray: uint8 Matrix indexed by [x, y]
+        """
+        # The Reshape, Channel Selection and Transpose are Views without Copies
+        return pic.reshape((height, width, bits // 8))[:, :, 0].T
 
     def stop_video(self):
         self._ser.Acquisition.Stop()
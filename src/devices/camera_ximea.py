@@ -1,9 +1,12 @@
+import ctypes
 import logging
 import datetime
 import numpy as np
 import pyqtgraph as pg
 
-from PyQt6.QtCore import Qt, pyqtSlot, QEvent, QTimer
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QEvent, QObject, QThread, QTimer
 from PyQt6.QtWidgets import QWidget, QFormLayout, QLabel, QHBoxLayout, QPushButton, QVBoxLayout, QLineEdit, QComboBox
 
 try:
@@ -21,6 +24,9 @@ class CameraXimea:
         self._img = xiapi.Image()
         self._last_picture = None
         self.dimensions = [0, 2047, 0, 2047]        # TODO: read out image size
+        # Every Picture is copied into this Buffer, so taking a Picture does not allocate
+        self._frame = np.empty((2048, 2048), dtype=np.uint8)
+        self._save_executor = None      # Worker Thread of save_picture, created on first use
 
         try:
             self._ser.open_device()
@@ -31,6 +37,8 @@ class CameraXimea:
         self._ser.start_acquisition()
 
     def disconnect(self):
+        if self._save_executor is not None:
+            self._save_executor.shutdown(wait=True)
         self._ser.stop_acquisition()
         self._ser.close_device()
 
@@ -75,27 +83,52 @@ class CameraXimea:
         return self._last_picture
 
     def save_picture(self, file_name: str):
-        np.save(file_name, self._last_picture)
+        """
+        Save last Picture on a Worker Thread, so writing the File does not block the GUI
+        :param str file_name: File Name, '.npy' is appended
+        :return Future: Done when the File is written, None if there is no Picture
+        """
+        if self._last_picture is None:
+            logging.error(f"{self.NAME}: Could not save Picture. No Picture taken")
+            return
+        # Copy, the last Picture is a View of the Frame Buffer and overwritten by the next Picture
+        picture = np.array(self._last_picture)
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1)
+        return self._save_executor.submit(self._write_picture, file_name, picture)
+
+    def _write_picture(self, file_name, picture):
+        """
+        Write Picture to File
+        :param str file_name: File Name, '.npy' is appended
+        :param np.ndarray picture: Picture
+        """
+        try:
+            np.save(file_name, picture, allow_pickle=False)
+        except OSError as err:
+            logging.error(f"{self.NAME}: Could not save Picture as '{file_name}.npy'. Error: '{err}'.")
+            return
         logging.info(f"{self.NAME}: Saved Picture as '{file_name}.npy'")
 
     def take_picture(self, save_as=None):
         """
-        Take Picture and return as Numpy Array
+        Take Picture and return as Numpy Array.
+        The Picture is a View of a Buffer that is overwritten by the next Picture, copy it to keep it.
         """
         # Take Picture
         try:
             self._ser.get_image(self._img)
         except xiapi.Xi_error:
             logging.warning(f"{self.NAME}: Could not take Picture")
-        data = self._img.get_image_data_numpy()
-
-        # Reshape and Resize
         try:
-            data = data.reshape((2048, 2048), order='F')
-            data = data[self.dimensions[0]:self.dimensions[1], self.dimensions[2]:self.dimensions[3]]
+            self._copy_image_to_frame()
         except ValueError:
             return
 
+        # Resize, the Camera stores the Pixels row by row.
+        # Transpose and Slice are Views, so the Picture is indexed by [x, y] as pyqtgraph expects without a Copy.
+        data = self._frame.T[self.dimensions[0]:self.dimensions[1], self.dimensions[2]:self.dimensions[3]]
+
         self._last_picture = data
 
         if save_as is not None:
@@ -103,10 +136,55 @@ class CameraXimea:
 
         return data
 
+    def _copy_image_to_frame(self):
+        """
+        Copy the Image Memory of the SDK into the Frame Buffer.
+        Unpadded Images are copied in one memmove, padded Images are unpacked by the SDK first.
+        """
+        if self._img.padding_x == 0 and self._img.width * self._img.height == self._frame.size:
+            ctypes.memmove(self._frame.ctypes.data, self._img.bp, self._frame.nbytes)
+        else:
+            np.copyto(self._frame, self._img.get_image_data_numpy().reshape(self._frame.shape))
+
     def gui_open(self):
         self.app = CamXimeaWindow(self)
 
 
+class CameraXimeaWorker(QObject):
+    """
+    Polls the Temperature of a CameraXimea on a Worker Thread, so the SDK Calls do not block the GUI
+    """
+
+    temperature_ready = pyqtSignal(str)
+
+    def __init__(self, device: CameraXimea, interval=2000):
+        """
+        :param CameraXimea device: Camera
+        :param int interval: Time in ms between Temperature Queries
+        """
+        super().__init__()
+        self._device = device
+        self._interval = interval
+        self._timer = None
+
+    @pyqtSlot()
+    def start_timer(self):
+        """
+        Create Temperature Timer on the Worker Thread
+        """
+        self._timer = QTimer()
+        self._timer.timeout.connect(self.poll_temperature)    # NOQA
+        self._timer.start(self._interval)
+        self.poll_temperature()
+
+    @pyqtSlot()
+    def poll_temperature(self):
+        """
+        Query Temperature
+        """
+        self.temperature_ready.emit(self._device.get_temperature())    # NOQA
+
+
 class CamXimeaWindow(QWidget):
     def __init__(self, device: CameraXimea):
         super().__init__()
@@ -136,12 +214,16 @@ class CamXimeaWindow(QWidget):
         self._line_edit_y_min = QLineEdit(str(self.device.dimensions[2]))
         self._line_edit_y_max = QLineEdit(str(self.device.dimensions[3]))
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._refresh_values)    # NOQA
-        self.timer.start(2000)
-
         self._initialize_widgets()
-        self._refresh_values()
+
+        # The Temperature is polled on a Worker Thread, the Window only shows it
+        self._thread = QThread()
+        self._worker = CameraXimeaWorker(self.device)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.start_timer)    # NOQA
+        self._worker.temperature_ready.connect(self._label_temperature.setText)    # NOQA
+        self._thread.start()
+
         self.show()
 
     def _initialize_widgets(self):
@@ -207,10 +289,6 @@ class CamXimeaWindow(QWidget):
             int(self._line_edit_y_max.text()),
         ]
 
-    @pyqtSlot()
-    def _refresh_values(self):
-        self._label_temperature.setText(self.device.get_temperature())
-
     @pyqtSlot()
     def _refresh_picture(self):
         pic = self.device.take_picture()
@@ -228,5 +306,6 @@ class CamXimeaWindow(QWidget):
         """
         Close Window Event
         """
-        self.timer.stop()
+        self._thread.quit()
+        self._thread.wait()
         event.accept()
@@ -0,0 +1,134 @@
+"""
+Shared Error Polling of all open Device Windows
+"""
+
+import time
+import logging
+import threading
+
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QObject, QThread, QTimer, QCoreApplication
+
+
+class ErrorPoller(QObject):
+    """
+    Queries the Errors of all registered Devices with one Timer on one Worker Thread.
+    The Devices are queried round-robin, so their Queries are spread evenly over the Poll Interval.
+    Only actual Errors are reported.
+    Devices whose Errors were already checked by a write or read within the Poll Interval are skipped,
+    so an idle Device costs one Query per Interval and a busy Device none.
+    """
+
+    error_occurred = pyqtSignal(object, str)
+    # Emitted by stop(), queued to the Worker Thread because the Timer can only be stopped there
+    _stop_requested = pyqtSignal()
+
+    _instance = None
+
+    def __init__(self, interval=2000):
+        """
+        :param int interval: Time in ms after which each Device is queried again
+        """
+        super().__init__()
+        self._interval = interval
+        self._devices = []
+        self._next = 0
+        self._lock = threading.Lock()
+        self._timer = None
+
+        self._thread = QThread()
+        self.moveToThread(self._thread)
+        self._thread.started.connect(self._start_timer)  # NOQA
+        self._stop_requested.connect(self._stop_timer)  # NOQA
+        self._thread.start()
+
+    @classmethod
+    def instance(cls):
+        """
+        Get the shared ErrorPoller, it is created on first use and stopped when the Application quits
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+            # Direct, so stop() runs on the GUI Thread and not on the Worker Thread the Poller lives on
+            QCoreApplication.instance().aboutToQuit.connect(  # NOQA
+                cls._instance.stop, Qt.ConnectionType.DirectConnection)
+        return cls._instance
+
+    def register(self, device):
+        """
+        Add Device to the polled Devices
+        :param device: Device
+        """
+        with self._lock:
+            if device not in self._devices:
+                self._devices.append(device)
+
+    def unregister(self, device):
+        """
+        Remove Device from the polled Devices
+        :param device: Device
+        """
+        with self._lock:
+            if device in self._devices:
+                self._devices.remove(device)
+
+    def stop(self):
+        """
+        Stop Timer and Worker Thread and wait until it finished, has to be called from another Thread than the Worker
+        """
+        self._stop_requested.emit()  # NOQA
+        self._thread.wait()
+
+    @pyqtSlot()
+    def _stop_timer(self):
+        """
+        Stop Timer and quit the Event Loop of the Worker Thread
+        """
+        if self._timer is not None:
+            self._timer.stop()
+        self._thread.quit()
+
+    @pyqtSlot()
+    def _start_timer(self):
+        """
+        Create Timer on the Worker Thread
+        """
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._poll)  # NOQA
+        self._timer.start(self._interval)
+
+    @pyqtSlot()
+    def _poll(self):
+        """
+        Query Error of the next Device.
+        The Timer is single shot and only restarted when the Query returned, so slow Devices do not queue up Polls.
+        """
+        with self._lock:
+            if not self._devices:
+                self._timer.start(self._interval)
+                return
+            self._next %= len(self._devices)
+            device = self._devices[self._next]
+            self._next += 1
+            interval = max(self._interval // len(self._devices), 1)
+
+        try:
+            self._query(device)
+        finally:
+            self._timer.start(interval)
+
+    def _query(self, device):
+        """
+        Query Error of Device and report it
+        :param device: Device
+        """
+        if time.monotonic() - getattr(device, "last_error_check", 0.0) < self._interval / 1000:
+            return
+        try:
+            err = device.get_error()
+        except ConnectionError as err:
+            logging.error(f"{device.name}: Could not query Error. Error: '{err}'.")
+            return
+        device.last_error_check = time.monotonic()
+        if err:
+            self.error_occurred.emit(device, err)    # NOQA
@@ -2,13 +2,14 @@
 Cobolt Laser Series 06-01
 """
 
-from PyQt6.QtCore import pyqtSlot, QTimer
-from PyQt6.QtWidgets import QWidget, QFormLayout, QLabel, QComboBox, QDoubleSpinBox, QVBoxLayout, QMainWindow, QFrame, \
-    QHBoxLayout
+from PyQt6.QtCore import pyqtSlot, QTimer, QSignalBlocker
+from PyQt6.QtWidgets import QWidget, QFormLayout, QLabel, QComboBox, QVBoxLayout, QMainWindow, QFrame, \
+    QHBoxLayout, QStackedWidget
 
 from src.devices.main_device import USBDevice
 from src.measurement.units import mA, mW
 from src.static_gui_elements.toggle_button import ToggleButton
+from src.static_gui_elements.delayed_spin_box import DelayedDoubleSpinBox
 
 
 class LaserCobolt(USBDevice):
@@ -303,20 +304,31 @@ class LaserCobolt(USBDevice):
 
 class LaserCoboltWindow(QMainWindow):
 
+    # Commands that switch the Laser into an Operating Mode
+    _MODE_COMMANDS = {
+        "Continuous Current": "ci",
+    }
+
     def __init__(self, device: LaserCobolt):
         super().__init__()
         # Variables
         self._device = device
         self._ci_mode_current = 0.0
+        self._timer = None
 
         # Appearance
         self.setWindowTitle(f"{self._device.name}")
         self.setGeometry(900, 500, 0, 0)
 
-        # Operating Mode
+        # Operating Mode, Modes without Builder show a Placeholder Form
+        self._mode_form_builders = {
+            "Continuous Current": self._build_current_form,
+        }
+        # Form Widget and Spin Boxes with their Getters by Operating Mode
+        self._mode_forms: dict[str, tuple[QWidget, list]] = {}
         widget_cb = QWidget()
         layout_cb = QFormLayout()
-        self._widget_form = QWidget()
+        self._widget_form = QStackedWidget()
         self._layout_mode = QVBoxLayout()
         self._cb_mode = QComboBox()
         self._cb_mode.addItems(["Continuous Current", "Continuous Power", "Digital Modulation"])
@@ -359,6 +371,7 @@ class LaserCoboltWindow(QMainWindow):
         self.setCentralWidget(widget_total)
 
         # Status Bar
+        self._last_error = ''
         self._status_bar_label = QLabel()
         self.statusBar().addWidget(self._status_bar_label)
 
@@ -375,36 +388,58 @@ class LaserCoboltWindow(QMainWindow):
     @pyqtSlot()
     def _handle_mode_changed(self):
         """
-        Replace Parameter Form according to selected operating mode
+        Show Parameter Form according to selected operating mode.
+        The Form of each Mode is built on first use and reused afterwards.
         """
-        widget_new = QWidget()
-        layout_new = QFormLayout()
-        widget_new.setLayout(layout_new)
-
         cur_mode = self._cb_mode.currentText()
-
-        # Create Layout depending on selected Waveform
-        if cur_mode == "Continuous Current":
-            self._device.read("ci")
-            sb_current = QDoubleSpinBox()
-            sb_current.setDecimals(0)
-            sb_current.setRange(0, 220)
-            sb_current.setValue(self._device.get_current()*mA)
-            sb_current.textChanged.connect(  # NOQA
-                lambda: self._device.set_laser_current(sb_current.value()*mA))
-            layout_new.addRow(QLabel("Current / mA"), sb_current)
-
-        elif cur_mode == "Continuous Power":
-            layout_new.addRow(QLabel("Not Implemented"))
-
-        elif cur_mode == "Digital Modulation":
-            layout_new.addRow(QLabel("Not Implemented"))
-
-        # Replace old Widget
-        self._layout_mode.replaceWidget(self._widget_form, widget_new)
-        self._widget_form.hide()
-        self._widget_form.destroy()
-        self._widget_form = widget_new
+        if cur_mode in self._MODE_COMMANDS:
+            self._device.read(self._MODE_COMMANDS[cur_mode])
+
+        if cur_mode in self._mode_forms:
+            # Refresh cached Form, the Values may have changed since it was shown last
+            widget, spin_boxes = self._mode_forms[cur_mode]
+            for spin_box, getter in spin_boxes:
+                with QSignalBlocker(spin_box):
+                    spin_box.setValue(getter())
+        else:
+            # Create Layout depending on selected Operating Mode
+            widget = QWidget()
+            layout = QFormLayout()
+            widget.setLayout(layout)
+            spin_boxes = self._mode_form_builders.get(cur_mode, self._build_stub_form)(layout)
+            self._mode_forms[cur_mode] = (widget, spin_boxes)
+            self._widget_form.addWidget(widget)
+
+        self._widget_form.setCurrentWidget(widget)
+
+    def _build_current_form(self, layout):
+        """
+        Add Current Spin Box to Form Layout
+        :param QFormLayout layout: Form Layout
+        :return list: Spin Boxes and their Getters
+        """
+        def get_current():
+            return self._device.get_current()*mA
+
+        sb_current = DelayedDoubleSpinBox()
+        sb_current.setDecimals(0)
+        sb_current.setRange(0, 220)
+        with QSignalBlocker(sb_current):
+            sb_current.setValue(get_current())
+        sb_current.delayedValueChanged.connect(  # NOQA
+            lambda current: self._device.set_laser_current(current*mA))
+        layout.addRow(QLabel("Current / mA"), sb_current)
+        return [(sb_current, get_current)]
+
+    @staticmethod
+    def _build_stub_form(layout):
+        """
+        Add Placeholder to Form Layout of an Operating Mode that is not implemented
+        :param QFormLayout layout: Form Layout
+        :return list: Spin Boxes and their Getters
+        """
+        layout.addRow(QLabel("Not Implemented"))
+        return []
 
     @pyqtSlot()
     def _handle_btn_output(self):
@@ -427,7 +462,8 @@ class LaserCoboltWindow(QMainWindow):
         Update Error in Status Bar
         """
         error_msg = self._device.get_error()
-        if error_msg:
+        if error_msg and error_msg != self._last_error:
+            self._last_error = error_msg
             self._status_bar_label.setText(f"\u26A0 Device Error: '{error_msg}'")
 
     @pyqtSlot()
@@ -435,6 +471,6 @@ class LaserCoboltWindow(QMainWindow):
         """
         Stop Timer when Window is closed
         """
-        if hasattr(self, "_timer"):
+        if self._timer is not None:
             self._timer.stop()
         event.accept()
@@ -111,8 +111,8 @@ class DLNSECLaserWindow(QWidget):
         line_edit_power = DelayedDoubleSpinBox()
         line_edit_power.setDecimals(0)
         line_edit_power.setRange(0, 100)
-        line_edit_power.textChanged.connect(
-            lambda: self._device.set_power(line_edit_power.text())
+        line_edit_power.delayedValueChanged.connect(
+            lambda power: self._device.set_power(power)
         )
         layout_settings.addRow(QLabel("Power / %"), line_edit_power)
 
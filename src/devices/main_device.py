@@ -1,6 +1,20 @@
 import serial       # package name 'pyserial'
 import pyvisa
+import time
 import logging
+import threading
+
+_COMMA_TO_DOT = str.maketrans(",", ".")
+
+
+def convert_decimal_notation(value):
+    """
+    Replace decimal Comma of String Values with a Point, numeric Values are returned unchanged
+    :param float | str value: Value
+    """
+    if isinstance(value, str):
+        return value.translate(_COMMA_TO_DOT)
+    return value
 
 
 class Device:
@@ -96,6 +110,8 @@ class USBDevice:
         self.settings = settings if settings is not None else {}
         self.name = name
         self.address = address
+        self.last_error_check = 0.0  # time.monotonic() of the last Error Query, Errors up to then were reported
+        self._termination_write = self.TERMINATION_WRITE.encode()
         try:
             self._ser = serial.Serial(self.address, baudrate=self.BAUDRATE, timeout=self.TIMEOUT, parity=self.PARITY,
                                       stopbits=self.STOPBITS, bytesize=self.BYTESIZE)
@@ -133,15 +149,17 @@ class USBDevice:
         :raises ConnectionError: Connection failed or Device Error occurred
         """
         try:
-            self._ser.write((message+self.TERMINATION_WRITE).encode())
+            self._ser.write(message.encode() + self._termination_write)
         except pyvisa.errors.VisaIOError as err:
             raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{err}'.")
         else:
             if error_checking:
                 last_error = self.get_error()
+                self.last_error_check = time.monotonic()
                 if last_error:
                     raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{last_error}'.")
-            logging.info(f"{self.name}: Send '{message}'.")
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(f"{self.name}: Send '{message}'.")
 
     def read(self, message: str = "", error_checking: bool = True) -> str:
         """
@@ -152,7 +170,8 @@ class USBDevice:
         :raises ConnectionError: Connection failed or Device Error occurred
         """
         self._ser.reset_input_buffer()
-        self.write(message)
+        # Errors are checked once after the Answer was read, not also after sending the Query
+        self.write(message, error_checking=False)
         try:
             ret = self._ser.readline().decode().strip()
         except Exception as err:
@@ -160,9 +179,11 @@ class USBDevice:
         else:
             if error_checking:
                 last_error = self.get_error()
+                self.last_error_check = time.monotonic()
                 if last_error:
                     raise ConnectionError(f"{self.name}: Could not read '{message}'. Error: '{last_error}'.")
-            logging.info(f"{self.name}: Recv '{ret}'.")
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(f"{self.name}: Recv '{ret}'.")
             return ret
 
     def open_gui(self) -> None:
@@ -181,6 +202,18 @@ class EthernetDevice:
     # Default Ethernet Settings
     TERMINATION_WRITE = ''
     TERMINATION_READ = 1
+    SUPPORTS_BATCHING = False   # Device accepts multiple SCPI Commands joined with ';:' in one Message
+
+    _resource_manager = None    # VISA Resource Manager shared by all Ethernet Devices
+
+    @staticmethod
+    def _get_resource_manager():
+        """
+        Get the shared VISA Resource Manager, it is created on first use
+        """
+        if EthernetDevice._resource_manager is None:
+            EthernetDevice._resource_manager = pyvisa.ResourceManager()
+        return EthernetDevice._resource_manager
 
     def __init__(self, name="Unnamed Device", address="", settings=None):
         """
@@ -192,12 +225,24 @@ class EthernetDevice:
         self.settings = settings if settings is not None else {}
         self.name = name
         self.address = address
+        self.last_error_check = 0.0  # time.monotonic() of the last Error Query, Errors up to then were reported
+        self._lock = threading.RLock()     # Serializes Communication when Device is used from multiple Threads
         try:
-            self._ser = pyvisa.ResourceManager().open_resource(f"TCPIP::{self.address}::INSTR")
-            self._ser.open()
+            # open_resource already opens the Session, opening it again would start a second one
+            self._ser = self._get_resource_manager().open_resource(f"TCPIP::{self.address}::INSTR")
         except pyvisa.errors.VisaIOError as err:
             raise ConnectionError(f"{self.name}: Could not connect. Error: '{err}'.")
 
+        # SCPI is request / response, so small messages should not be delayed by Nagle's algorithm.
+        # The session is kept for the lifetime of the Device, keepalive stops idle connections from being dropped
+        # in between, which would otherwise cost a reconnect on the next command.
+        for attribute, attribute_name in [(pyvisa.constants.VI_ATTR_TCPIP_NODELAY, "TCP_NODELAY"),
+                                          (pyvisa.constants.VI_ATTR_TCPIP_KEEPALIVE, "SO_KEEPALIVE")]:
+            try:
+                self._ser.set_visa_attribute(attribute, pyvisa.constants.VI_TRUE)
+            except (pyvisa.errors.VisaIOError, NotImplementedError) as err:
+                logging.info(f"{self.name}: Could not set {attribute_name}. Error: '{err}'.")
+
     def disconnect(self) -> None:
         """
         Disconnect from Device
@@ -226,16 +271,73 @@ class EthernetDevice:
         :param bool error_checking: Check if Error occurred after writing
         :raises ConnectionError: Connection failed or Device Error occurred
         """
-        try:
-            self._ser.write(message+self.TERMINATION_WRITE)    # NOQA
-        except pyvisa.errors.VisaIOError as err:
-            raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{err}'.")
-        else:
-            if error_checking:
-                error_msg = self.get_error()
-                if error_msg:
-                    raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{error_msg}'.")
-            logging.info(f"{self.name}: Send '{message}'.")
+        with self._lock:
+            try:
+                self._ser.write(message+self.TERMINATION_WRITE)    # NOQA
+            except pyvisa.errors.VisaIOError as err:
+                raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{err}'.")
+            else:
+                if error_checking:
+                    error_msg = self.get_error()
+                    self.last_error_check = time.monotonic()
+                    if error_msg:
+                        raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{error_msg}'.")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info(f"{self.name}: Send '{message}'.")
+
+    def write_batch(self, messages: list, error_checking: bool = True) -> None:
+        """
+        Write multiple SCPI Commands to Device in one Message.
+        Commands have to start with their full Path, they are joined with ';:'.
+        Devices without SUPPORTS_BATCHING get one Message per Command.
+        :param list messages: Commands to send
+        :param bool error_checking: Check if Error occurred after writing
+        :raises ConnectionError: Connection failed or Device Error occurred
+        """
+        if not self.SUPPORTS_BATCHING:
+            for message in messages:
+                self.write(message, error_checking=error_checking)
+            return
+        self.write(";:".join(messages), error_checking=error_checking)
+
+    def read_batch(self, messages: list, error_checking: bool = True) -> list:
+        """
+        Read multiple SCPI Queries from Device in one Message.
+        Queries have to start with their full Path, they are joined with ';:' and the Answers are split at ';'.
+        Devices without SUPPORTS_BATCHING get one Message per Query.
+        :param list messages: Queries to send
+        :param bool error_checking: Check if Error occurred after reading
+        :return: Received Answers in the Order of the Queries
+        :raises ConnectionError: Connection failed or Device Error occurred
+        """
+        if not self.SUPPORTS_BATCHING:
+            return [self.read(message, error_checking=error_checking) for message in messages]
+        return self.read(";:".join(messages), error_checking=error_checking).split(";")
+
+    def write_binary(self, message: str, values, datatype: str = 'h', is_big_endian: bool = True,
+                     error_checking: bool = True) -> None:
+        """
+        Write Message followed by Values as IEEE-488.2 definite length binary Block to Device
+        :param str message: Message to send before the Block
+        :param values: Values to send
+        :param str datatype: struct Format Character of one Value
+        :param bool is_big_endian: Byte Order of the Values
+        :param bool error_checking: Check if Error occurred after writing
+        :raises ConnectionError: Connection failed or Device Error occurred
+        """
+        with self._lock:
+            try:
+                self._ser.write_binary_values(message, values, datatype=datatype, is_big_endian=is_big_endian)  # NOQA
+            except pyvisa.errors.VisaIOError as err:
+                raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{err}'.")
+            else:
+                if error_checking:
+                    error_msg = self.get_error()
+                    self.last_error_check = time.monotonic()
+                    if error_msg:
+                        raise ConnectionError(f"{self.name}: Could not write '{message}'. Error: '{error_msg}'.")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info(f"{self.name}: Send '{message}' with {len(values)} binary Values.")
 
     def read(self, message: str = "", error_checking: bool = True) -> str:
         """
@@ -245,17 +347,20 @@ class EthernetDevice:
         :return: Received Answer
         :raises ConnectionError: Connection failed or Device Error occurred
         """
-        try:
-            ret = self._ser.query(message)[:-self.TERMINATION_READ]  # NOQA
-        except pyvisa.errors.VisaIOError as err:
-            raise ConnectionError(f"{self.name}: Could not read '{message}'. Error: '{err}'.")
-        else:
-            if error_checking:
-                error_msg = self.get_error()
-                if error_msg:
-                    raise ConnectionError(f"{self.name}: Could not read '{message}'. Error: '{self.get_error()}'.")
-            logging.info(f"{self.name}: Recv '{ret}'.")
-            return ret
+        with self._lock:
+            try:
+                ret = self._ser.query(message)[:-self.TERMINATION_READ]  # NOQA
+            except pyvisa.errors.VisaIOError as err:
+                raise ConnectionError(f"{self.name}: Could not read '{message}'. Error: '{err}'.")
+            else:
+                if error_checking:
+                    error_msg = self.get_error()
+                    self.last_error_check = time.monotonic()
+                    if error_msg:
+                        raise ConnectionError(f"{self.name}: Could not read '{message}'. Error: '{error_msg}'.")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info(f"{self.name}: Recv '{ret}'.")
+                return ret
 
     def open_gui(self) -> None:
         """
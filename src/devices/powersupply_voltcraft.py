@@ -4,7 +4,7 @@ Voltcraft Power Supply PPS-11360
 
 import serial
 
-from PyQt6.QtCore import QTimer, pyqtSlot
+from PyQt6.QtCore import QTimer, pyqtSlot, QSignalBlocker
 from PyQt6.QtWidgets import QWidget, QLabel, QFormLayout, QHBoxLayout
 
 from src.static_gui_elements.toggle_button import ToggleButton
@@ -215,6 +215,7 @@ class PPS11360Window(QWidget):
         super().__init__()
         # Variables
         self._device = device
+        self._timer = None
 
         # Appearance
         self.setWindowTitle(f"{self._device.name}")
@@ -240,13 +241,15 @@ class PPS11360Window(QWidget):
         layout_set_values.addRow(QLabel("<b>Set Values</b>"))
         self._line_edit_voltage = DelayedDoubleSpinBox()
         self._line_edit_voltage.setRange(1, self._device.max_voltage)
-        self._line_edit_voltage.setValue(float(voltage))
-        self._line_edit_voltage.valueChanged.connect(self._handle_line_edit_voltage_changed)
+        with QSignalBlocker(self._line_edit_voltage):
+            self._line_edit_voltage.setValue(float(voltage))
+        self._line_edit_voltage.delayedValueChanged.connect(self._handle_line_edit_voltage_changed)    # NOQA
         layout_set_values.addRow(QLabel("Voltage / V"), self._line_edit_voltage)
         self._line_edit_current = DelayedDoubleSpinBox()
         self._line_edit_current.setRange(0, self._device.max_current)
-        self._line_edit_current.setValue(float(current))
-        self._line_edit_current.valueChanged.connect(self._handle_line_edit_current_changed)
+        with QSignalBlocker(self._line_edit_current):
+            self._line_edit_current.setValue(float(current))
+        self._line_edit_current.delayedValueChanged.connect(self._handle_line_edit_current_changed)    # NOQA
         layout_set_values.addRow(QLabel("Current / A"), self._line_edit_current)
         self._button_output = ToggleButton(state=True)
         self._device.set_output(True)
@@ -278,19 +281,21 @@ class PPS11360Window(QWidget):
         self._label_current.setText(str(current))
         self._label_limiter.setText(limiter.upper())
 
-    @pyqtSlot()
-    def _handle_line_edit_voltage_changed(self):
+    @pyqtSlot(float)
+    def _handle_line_edit_voltage_changed(self, voltage):
         """
         Set Voltage
+        :param float voltage: Voltage in V
         """
-        self._device.set_voltage(float(self._line_edit_voltage.value()))
+        self._device.set_voltage(voltage)
 
-    @pyqtSlot()
-    def _handle_line_edit_current_changed(self):
+    @pyqtSlot(float)
+    def _handle_line_edit_current_changed(self, current):
         """
         Set Current
+        :param float current: Current in A
         """
-        self._device.set_current(float(self._line_edit_current.value()))
+        self._device.set_current(current)
 
     @pyqtSlot()
     def _handle_button_output(self):
@@ -304,6 +309,6 @@ class PPS11360Window(QWidget):
         """
         Stop Timer when Window is closed
         """
-        if hasattr(self, "_timer"):
+        if self._timer is not None:
             self._timer.stop()
         event.accept()
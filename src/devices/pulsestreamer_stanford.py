@@ -2,10 +2,13 @@
 Stanford Pulse Streamer
 """
 
-from PyQt6.QtCore import pyqtSlot, QTimer
+from PyQt6.QtCore import Qt, pyqtSlot, QSignalBlocker
 from PyQt6.QtWidgets import QWidget, QLabel, QComboBox, QMainWindow, QGridLayout
 
-from src.devices.main_device import EthernetDevice
+from src.devices.main_device import EthernetDevice, convert_decimal_notation
+from src.devices.error_poller import ErrorPoller
+from src.devices.state_reader import StateReader
+from src.measurement.units import us, V
 from src.static_gui_elements.delayed_spin_box import DelayedDoubleSpinBox
 
 
@@ -28,8 +31,12 @@ class PulsestreamerStanford(EthernetDevice):
     def get_error(self):
         """
         Get Last Error
+        :return str: Empty String if no Error occurred, otherwise Error Code
         """
-        return self.read("LERR?")
+        error_code = self.read("LERR?", error_checking=False)
+        if error_code == '0':
+            return ''
+        return error_code
 
     def clear(self):
         """
@@ -75,9 +82,7 @@ class PulsestreamerStanford(EthernetDevice):
         """
         Set Amplitude in V
         """
-        if isinstance(amplitude, str):
-            amplitude = amplitude.replace(',', '.')
-        self.write(f"LAMP{channel},{amplitude}")
+        self.write(f"LAMP{channel},{convert_decimal_notation(amplitude)}")
 
     def get_amplitude(self, channel):
         """
@@ -89,9 +94,7 @@ class PulsestreamerStanford(EthernetDevice):
         """
         Set Offset in V
         """
-        if isinstance(offset, str):
-            offset = offset.replace(',', '.')
-        self.write(f"LOFF{channel},{offset}")
+        self.write(f"LOFF{channel},{convert_decimal_notation(offset)}")
 
     def get_offset(self, channel):
         """
@@ -103,9 +106,7 @@ class PulsestreamerStanford(EthernetDevice):
         """
         Set Start Time in s
         """
-        if isinstance(time_start, str):
-            time_start = time_start.replace(',', '.')
-        self.write(f"DLAY{2*channel},0,{time_start}")
+        self.write(f"DLAY{2*channel},0,{convert_decimal_notation(time_start)}")
 
     def get_time_start(self, channel):
         """
@@ -117,9 +118,7 @@ class PulsestreamerStanford(EthernetDevice):
         """
         Set Stop Time in s
         """
-        if isinstance(time_stop, str):
-            time_stop = time_stop.replace(',', '.')
-        self.write(f"DLAY{2*channel+1},0,{time_stop}")
+        self.write(f"DLAY{2*channel+1},0,{convert_decimal_notation(time_stop)}")
 
     def get_time_stop(self, channel):
         """
@@ -184,10 +183,23 @@ class PulsestreamerStanford(EthernetDevice):
 
 class StanfordPulseStreamerWindow(QMainWindow):
 
+    # Rows (Label, Decimals, Range, Parameter Name, Unit of the shown Value) of each Channel Column
+    _PARAMETERS = [
+        ("Start / us", 6, (0, 1E6), "time_start", us),
+        ("Stop / us", 6, (0, 1E6), "time_stop", us),
+        ("Amplitude / V", 2, (0, 5), "amplitude", V),
+        ("Offset / V", 3, (0, 5), "offset", V),
+    ]
+
     def __init__(self, device: PulsestreamerStanford):
         super().__init__()
         # Variables
         self._device = device
+        self._error_poller = None
+        self._state_reader = None
+        # Spin Box and Unit of the shown Value by (Parameter Name, Channel)
+        self._spin_boxes: dict[tuple[str, int], tuple[DelayedDoubleSpinBox, float]] = {}
+        self._combo_boxes_polarity: dict[int, QComboBox] = {}   # Polarity Combo Box by Channel
 
         # Appearance
         self.setWindowTitle(f"{self._device.name}")
@@ -198,211 +210,124 @@ class StanfordPulseStreamerWindow(QMainWindow):
         layout = QGridLayout()
 
         # Label
-        layout.addWidget(QLabel("Start / us"), 1, 0)
-        layout.addWidget(QLabel("Stop / us"), 2, 0)
-        layout.addWidget(QLabel("Offset / V"), 3, 0)
-        layout.addWidget(QLabel("Amplitude / V"), 4, 0)
-        layout.addWidget(QLabel("Polarity"), 5, 0)
-
-        # Channel 1
-        layout.addWidget(QLabel("Channel 1"), 0, 1)
-        line_edit_ch1_start = DelayedDoubleSpinBox()
-        line_edit_ch1_start.setDecimals(6)
-        line_edit_ch1_start.setRange(0, 1E6)
-        line_edit_ch1_start.setValue(float(self._device.get_time_start(channel=1))*1E-6)
-        line_edit_ch1_start.textChanged.connect(
-            lambda: self._device.set_time_start(channel=1, time_start=float(line_edit_ch1_start.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch1_start, 1, 1)
-        line_edit_ch1_stop = DelayedDoubleSpinBox()
-        line_edit_ch1_stop.setDecimals(6)
-        line_edit_ch1_stop.setRange(0, 1E6)
-        line_edit_ch1_stop.setValue(float(self._device.get_time_stop(channel=1))*1E-6)
-        line_edit_ch1_stop.textChanged.connect(
-            lambda: self._device.set_time_stop(channel=1, time_stop=float(line_edit_ch1_stop.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch1_stop, 2, 1)
-        line_edit_ch1_amplitude = DelayedDoubleSpinBox()
-        line_edit_ch1_amplitude.setDecimals(2)
-        line_edit_ch1_amplitude.setRange(0, 5)
-        line_edit_ch1_amplitude.setValue(self._device.get_amplitude(channel=1))
-        line_edit_ch1_amplitude.textChanged.connect(
-            lambda: self._device.set_amplitude(channel=1, amplitude=line_edit_ch1_amplitude.text())
-        )
-        layout.addWidget(line_edit_ch1_amplitude, 3, 1)
-        line_edit_ch1_offset = DelayedDoubleSpinBox()
-        line_edit_ch1_offset.setDecimals(3)
-        line_edit_ch1_offset.setRange(0, 5)
-        line_edit_ch1_offset.setValue(self._device.get_offset(channel=1))
-        line_edit_ch1_offset.textChanged.connect(
-            lambda: self._device.set_offset(channel=1, offset=line_edit_ch1_offset.text())
-        )
-        layout.addWidget(line_edit_ch1_offset, 4, 1)
-        line_edit_ch1_polarity = QComboBox()
-        line_edit_ch1_polarity.addItems(["Negative", "Positive"])
-        line_edit_ch1_polarity.setCurrentIndex(self._device.get_polarity(channel=1))
-        line_edit_ch1_polarity.currentIndexChanged.connect(
-            lambda: self._device.set_polarity(channel=1, polarity=line_edit_ch1_polarity.currentIndex())
-        )
-        layout.addWidget(line_edit_ch1_polarity, 5, 1)
-
-        # Channel 2
-        layout.addWidget(QLabel("Channel 2"), 0, 2)
-        line_edit_ch2_start = DelayedDoubleSpinBox()
-        line_edit_ch2_start.setDecimals(6)
-        line_edit_ch2_start.setRange(0, 1E6)
-        line_edit_ch2_start.setValue(float(self._device.get_time_start(channel=2))*1E-6)
-        line_edit_ch2_start.textChanged.connect(
-            lambda: self._device.set_time_start(channel=2, time_start=float(line_edit_ch2_start.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch2_start, 1, 2)
-        line_edit_ch2_stop = DelayedDoubleSpinBox()
-        line_edit_ch2_stop.setDecimals(6)
-        line_edit_ch2_stop.setRange(0, 1E6)
-        line_edit_ch2_stop.setValue(float(self._device.get_time_stop(channel=2))*1E-6)
-        line_edit_ch2_stop.textChanged.connect(
-            lambda: self._device.set_time_stop(channel=2, time_stop=float(line_edit_ch2_stop.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch2_stop, 2, 2)
-        line_edit_ch2_amplitude = DelayedDoubleSpinBox()
-        line_edit_ch2_amplitude.setDecimals(2)
-        line_edit_ch2_amplitude.setRange(0, 5)
-        line_edit_ch2_amplitude.setValue(self._device.get_amplitude(channel=2))
-        line_edit_ch2_amplitude.textChanged.connect(
-            lambda: self._device.set_amplitude(channel=2, amplitude=line_edit_ch2_amplitude.text())
-        )
-        layout.addWidget(line_edit_ch2_amplitude, 3, 2)
-        line_edit_ch2_offset = DelayedDoubleSpinBox()
-        line_edit_ch2_offset.setDecimals(3)
-        line_edit_ch2_offset.setRange(0, 5)
-        line_edit_ch2_offset.setValue(self._device.get_offset(channel=2))
-        line_edit_ch2_offset.textChanged.connect(
-            lambda: self._device.set_offset(channel=2, offset=line_edit_ch2_offset.text())
-        )
-        layout.addWidget(line_edit_ch2_offset, 4, 2)
-        line_edit_ch2_polarity = QComboBox()
-        line_edit_ch2_polarity.addItems(["Negative", "Positive"])
-        line_edit_ch2_polarity.setCurrentIndex(self._device.get_polarity(channel=2))
-        line_edit_ch2_polarity.currentIndexChanged.connect(
-            lambda: self._device.set_polarity(channel=2, polarity=line_edit_ch2_polarity.currentIndex())
-        )
-        layout.addWidget(line_edit_ch2_polarity, 5, 2)
-
-        # Channel 3
-        layout.addWidget(QLabel("Channel 3"), 0, 3)
-        line_edit_ch3_start = DelayedDoubleSpinBox()
-        line_edit_ch3_start.setDecimals(6)
-        line_edit_ch3_start.setRange(0, 1E6)
-        line_edit_ch3_start.setValue(float(self._device.get_time_start(channel=3))*1E-6)
-        line_edit_ch3_start.textChanged.connect(
-            lambda: self._device.set_time_start(channel=3, time_start=float(line_edit_ch3_start.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch3_start, 1, 3)
-        line_edit_ch3_stop = DelayedDoubleSpinBox()
-        line_edit_ch3_stop.setDecimals(6)
-        line_edit_ch3_stop.setRange(0, 1E6)
-        line_edit_ch3_stop.setValue(float(self._device.get_time_stop(channel=3))*1E-6)
-        line_edit_ch3_stop.textChanged.connect(
-            lambda: self._device.set_time_stop(channel=3, time_stop=float(line_edit_ch3_stop.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch3_stop, 2, 3)
-        line_edit_ch3_amplitude = DelayedDoubleSpinBox()
-        line_edit_ch3_amplitude.setDecimals(2)
-        line_edit_ch3_amplitude.setRange(0, 5)
-        line_edit_ch3_amplitude.setValue(self._device.get_amplitude(channel=3))
-        line_edit_ch3_amplitude.textChanged.connect(
-            lambda: self._device.set_amplitude(channel=3, amplitude=line_edit_ch3_amplitude.text())
-        )
-        layout.addWidget(line_edit_ch3_amplitude, 3, 3)
-        line_edit_ch3_offset = DelayedDoubleSpinBox()
-        line_edit_ch3_offset.setDecimals(3)
-        line_edit_ch3_offset.setRange(0, 5)
-        line_edit_ch3_offset.setValue(self._device.get_offset(channel=3))
-        line_edit_ch3_offset.textChanged.connect(
-            lambda: self._device.set_offset(channel=3, offset=line_edit_ch3_offset.text())
-        )
-        layout.addWidget(line_edit_ch3_offset, 4, 3)
-        line_edit_ch3_polarity = QComboBox()
-        line_edit_ch3_polarity.addItems(["Negative", "Positive"])
-        line_edit_ch3_polarity.setCurrentIndex(self._device.get_polarity(channel=3))
-        line_edit_ch3_polarity.currentIndexChanged.connect(
-            lambda: self._device.set_polarity(channel=3, polarity=line_edit_ch3_polarity.currentIndex())
-        )
-        layout.addWidget(line_edit_ch3_polarity, 5, 3)
-
-        # Channel 4
-        layout.addWidget(QLabel("Channel 4"), 0, 4)
-        line_edit_ch4_start = DelayedDoubleSpinBox()
-        line_edit_ch4_start.setDecimals(6)
-        line_edit_ch4_start.setRange(0, 1E6)
-        line_edit_ch4_start.setValue(float(self._device.get_time_start(channel=4))*1E-6)
-        line_edit_ch4_start.textChanged.connect(
-            lambda: self._device.set_time_start(channel=4, time_start=float(line_edit_ch4_start.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch4_start, 1, 4)
-        line_edit_ch4_stop = DelayedDoubleSpinBox()
-        line_edit_ch4_stop.setDecimals(6)
-        line_edit_ch4_stop.setRange(0, 1E6)
-        line_edit_ch4_stop.setValue(float(self._device.get_time_stop(channel=4))*1E-6)
-        line_edit_ch4_stop.textChanged.connect(
-            lambda: self._device.set_time_stop(channel=4, time_stop=float(line_edit_ch4_stop.text())*1E-6)
-        )
-        layout.addWidget(line_edit_ch4_stop, 2, 4)
-        line_edit_ch4_amplitude = DelayedDoubleSpinBox()
-        line_edit_ch4_amplitude.setDecimals(2)
-        line_edit_ch4_amplitude.setRange(0, 5)
-        line_edit_ch4_amplitude.setValue(self._device.get_amplitude(channel=4))
-        line_edit_ch4_amplitude.textChanged.connect(
-            lambda: self._device.set_amplitude(channel=4, amplitude=line_edit_ch4_amplitude.text())
-        )
-        layout.addWidget(line_edit_ch4_amplitude, 3, 4)
-        line_edit_ch4_offset = DelayedDoubleSpinBox()
-        line_edit_ch4_offset.setDecimals(3)
-        line_edit_ch4_offset.setRange(0, 5)
-        line_edit_ch4_offset.setValue(self._device.get_offset(channel=4))
-        line_edit_ch4_offset.textChanged.connect(
-            lambda: self._device.set_offset(channel=4, offset=line_edit_ch4_offset.text())
-        )
-        layout.addWidget(line_edit_ch4_offset, 4, 4)
-        line_edit_ch4_polarity = QComboBox()
-        line_edit_ch4_polarity.addItems(["Negative", "Positive"])
-        line_edit_ch4_polarity.setCurrentIndex(self._device.get_polarity(channel=4))
-        line_edit_ch4_polarity.currentIndexChanged.connect(
-            lambda: self._device.set_polarity(channel=4, polarity=line_edit_ch4_polarity.currentIndex())
-        )
-        layout.addWidget(line_edit_ch4_polarity, 5, 4)
+        for row, (label, *_) in enumerate(self._PARAMETERS, start=1):
+            layout.addWidget(QLabel(label), row, 0)
+        layout.addWidget(QLabel("Polarity"), len(self._PARAMETERS) + 1, 0)
+
+        # Channels
+        for channel in range(1, 5):
+            layout.addWidget(QLabel(f"Channel {channel}"), 0, channel)
+            for row, (_, decimals, value_range, name, unit) in enumerate(self._PARAMETERS, start=1):
+                layout.addWidget(self._create_spin_box(channel, decimals, value_range, name, unit), row, channel)
+            combo_box_polarity = QComboBox()
+            combo_box_polarity.addItems(["Negative", "Positive"])
+            combo_box_polarity.currentIndexChanged.connect(
+                lambda polarity, channel=channel: self._device.set_polarity(channel=channel, polarity=polarity)
+            )
+            self._combo_boxes_polarity[channel] = combo_box_polarity
+            layout.addWidget(combo_box_polarity, len(self._PARAMETERS) + 1, channel)
 
         widget.setLayout(layout)
+        widget.setEnabled(False)
         self.setCentralWidget(widget)
 
         # Status Bar
-        self._device.clear()
-        self._last_error = self._device.get_error()
+        self._last_error = ''
         self._status_bar_label = QLabel()
         self.statusBar().addWidget(self._status_bar_label)
 
-        # Timer
-        self._timer = QTimer()
-        self._timer.timeout.connect(self._update_error_label)
-        self._timer.start(2000)
+        # Status Bar, the Error is queried by the shared ErrorPoller so the GUI does not block
+        self._error_poller = ErrorPoller.instance()
+        self._error_poller.error_occurred.connect(self._handle_device_error)  # NOQA
+        self._error_poller.register(self._device)
+
+        # Initialization, the Device State is read on a Worker Thread and filled in when it is ready
+        self._state_reader = StateReader(self._device, self._read_state)
+        self._state_reader.state_ready.connect(self._handle_state_ready, Qt.ConnectionType.QueuedConnection)  # NOQA
+        self._state_reader.state_failed.connect(self._handle_state_failed, Qt.ConnectionType.QueuedConnection)  # NOQA
+        self._state_reader.start()
 
         self.show()
 
-    @pyqtSlot()
-    def _update_error_label(self):
+    def _read_state(self):
+        """
+        Read Device State shown in the Window. Runs on the Worker Thread of the StateReader.
+        """
+        self._device.clear()
+        return {
+            "parameters": {
+                key: getattr(self._device, f"get_{key[0]}")(key[1]) for key in self._spin_boxes
+            },
+            "polarity": {channel: self._device.get_polarity(channel) for channel in self._combo_boxes_polarity},
+            "error": self._device.get_error(),
+        }
+
+    @pyqtSlot(dict)
+    def _handle_state_ready(self, state):
+        """
+        Fill Widgets with Device State without writing it back to the Device
+        """
+        for key, value in state["parameters"].items():
+            spin_box, unit = self._spin_boxes[key]
+            with QSignalBlocker(spin_box):
+                spin_box.setValue(value / unit)
+        for channel, polarity in state["polarity"].items():
+            with QSignalBlocker(self._combo_boxes_polarity[channel]):
+                self._combo_boxes_polarity[channel].setCurrentIndex(polarity)
+        if state["error"]:
+            self._update_error_label(state["error"])
+        self.centralWidget().setEnabled(True)
+
+    @pyqtSlot(str)
+    def _handle_state_failed(self, err):
+        """
+        Show Error of the failed State Read and enable the Widgets anyway, so Settings can still be written
+        """
+        self._update_error_label(err)
+        self.centralWidget().setEnabled(True)
+
+    def _create_spin_box(self, channel, decimals, value_range, name, unit):
+        """
+        Create Spin Box for a Device Parameter of a Channel, its Value is filled in when the Device State is read
+        :param int channel: Channel Number
+        :param int decimals: Decimals of Spin Box
+        :param tuple value_range: Minimum and Maximum of Spin Box
+        :param str name: Parameter Name, the Device has to implement 'get_{name}' and 'set_{name}'
+        :param float unit: Unit of the shown Value
+        :return DelayedDoubleSpinBox: Spin Box
+        """
+        setter = getattr(self._device, f"set_{name}")
+        spin_box = DelayedDoubleSpinBox()
+        spin_box.setDecimals(decimals)
+        spin_box.setRange(*value_range)
+        spin_box.delayedValueChanged.connect(lambda value: setter(channel, value * unit))
+        self._spin_boxes[(name, channel)] = (spin_box, unit)
+        return spin_box
+
+    @pyqtSlot(object, str)
+    def _handle_device_error(self, device, err):
+        """
+        Update Error in Status Bar if it belongs to the Device of this Window
+        """
+        if device is self._device:
+            self._update_error_label(err)
+
+    def _update_error_label(self, err):
         """
         Update Error in Status Bar
         """
-        err = self._device.get_error()
-        if err != '0':
+        if err != self._last_error:
             self._last_error = err
             self._status_bar_label.setText(f"\u26A0 Device Error: '{self._last_error}'")
 
     @pyqtSlot()
     def closeEvent(self, event):
         """
-        Stop Timer when Window is closed
+        Stop Error Polling when Window is closed
         """
-        if hasattr(self, "_timer"):
-            self._timer.stop()
+        if self._error_poller is not None:
+            self._error_poller.unregister(self._device)
+            self._error_poller.error_occurred.disconnect(self._handle_device_error)  # NOQA
+        if self._state_reader is not None:
+            self._state_reader.wait()
         event.accept()
@@ -43,6 +43,7 @@ class PulsestreamerSwabian:
         if "Digital Channel" in self.settings:
             for name, value in self.settings["Digital Channel"].items():
                 self.digital_channel[name] = value
+        self._channel_index = {name: index for index, name in enumerate(self.digital_channel)}
         if "Clock Out Channel" in self.settings and self.settings["Clock Out Channel"]:
             self.set_function_clock(channel=self.settings["Clock Channel"])
         if "Clock In" in self.settings and self.settings["Clock In"]:
@@ -94,7 +95,10 @@ class PulsestreamerSwabian:
         if isinstance(channel, int):
             return channel
         if isinstance(channel, str):
-            return self.digital_channel.index(channel)
+            try:
+                return self._channel_index[channel]
+            except KeyError:
+                raise ValueError(f"{self.name}: Unknown Channel '{channel}'") from None
         raise ValueError("Channel has to be int or str")
 
     def set_function_clock(self, channel):
@@ -244,38 +248,11 @@ class SwabianPulseStreamerWindow(QMainWindow):
         # Channel Buttons
         layout_channel_buttons = QFormLayout()
         layout_channel_buttons.addRow(QLabel("<b>Channel</b>"), QLabel("<b>State</b>"))
-        button_d0 = ToggleButton(state=self._device.get_output_state(channel=0))
-        button_d0.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=0, state=button_d0.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(0)), button_d0)
-        button_d1 = ToggleButton(state=self._device.get_output_state(channel=1))
-        button_d1.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=1, state=button_d1.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(1)), button_d1)
-        button_d2 = ToggleButton(state=self._device.get_output_state(channel=2))
-        button_d2.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=2, state=button_d2.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(2)), button_d2)
-        button_d3 = ToggleButton(state=self._device.get_output_state(channel=3))
-        button_d3.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=3, state=button_d3.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(3)), button_d3)
-        button_d4 = ToggleButton(state=self._device.get_output_state(channel=4))
-        button_d4.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=4, state=button_d4.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(4)), button_d4)
-        button_d5 = ToggleButton(state=self._device.get_output_state(channel=5))
-        button_d5.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=5, state=button_d5.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(5)), button_d5)
-        button_d6 = ToggleButton(state=self._device.get_output_state(channel=6))
-        button_d6.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=6, state=button_d6.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(6)), button_d6)
-        button_d7 = ToggleButton(state=self._device.get_output_state(channel=7))
-        button_d7.clicked.connect(
-            lambda: self._device.set_constant_ttl(channel=7, state=button_d7.isChecked()))
-        layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(7)), button_d7)
+        for channel in range(8):
+            button = ToggleButton(state=self._device.get_output_state(channel=channel))
+            button.clicked.connect(    # NOQA
+                lambda checked, channel=channel: self._device.set_constant_ttl(channel=channel, state=checked))
+            layout_channel_buttons.addRow(QLabel(self._device.get_channel_str(channel)), button)
 
         # Separator
         line = QFrame()
@@ -7,10 +7,10 @@ Windfreak SynthHDv2 Radio Frequency Generator
 # If that happens, Frequency and Phase start drifting around.
 # reset() sets it back to 5. Just call that function at the start of every measurement, and you should be fine.
 
-from PyQt6.QtCore import pyqtSlot, QTimer
+from PyQt6.QtCore import pyqtSlot, QTimer, QSignalBlocker
 from PyQt6.QtWidgets import QLabel, QFormLayout, QWidget, QGridLayout
 
-from src.devices.main_device import USBDevice
+from src.devices.main_device import USBDevice, convert_decimal_notation
 from src.static_gui_elements.toggle_button import ToggleButton
 from src.static_gui_elements.delayed_spin_box import DelayedDoubleSpinBox
 
@@ -105,8 +105,7 @@ class RFGWindfreak(USBDevice):
         """
         Set Frequency in MHz
         """
-        if isinstance(frequency, str):
-            frequency = frequency.replace(',', '.')
+        frequency = convert_decimal_notation(frequency)
 
         assert 53 <= float(frequency) < 14000, "Frequency has to be between 53MHz and 14000MHz"
 
@@ -127,8 +126,7 @@ class RFGWindfreak(USBDevice):
         """
         Set Amplitude in dBm
         """
-        if isinstance(amplitude, str):
-            amplitude = amplitude.replace(',', '.')
+        amplitude = convert_decimal_notation(amplitude)
 
         assert -60 <= float(amplitude) <= 20, "Amplitude has to be between -60dBm and 20dBm"
 
@@ -412,12 +410,7 @@ class SynthHDv2RFGWindow(QWidget):
         self._label_temperature = QLabel()
         layout_info.addRow(QLabel("Temperature / °C"), self._label_temperature)
         self._device.set_clock_reference_frequency(30)
-        self.line_edit_clock_frequency = DelayedDoubleSpinBox()
-        self.line_edit_clock_frequency.setRange(10, 100)
-        self.line_edit_clock_frequency.setValue(self._device.get_clock_reference_frequency())
-        # self.line_edit_clock_frequency.valueChanged.connect(
-        #     lambda: self._device.set_clock_reference_frequency(frequency=self.line_edit_clock_frequency.text())
-        # )
+        self.line_edit_clock_frequency = self._create_spin_box((10, 100), self._device.get_clock_reference_frequency())
         layout_info.addRow(QLabel("Clock Frequency / MHz"), self.line_edit_clock_frequency)
         widget_info.setLayout(layout_info)
 
@@ -425,19 +418,13 @@ class SynthHDv2RFGWindow(QWidget):
         widget_line_edit_ch1 = QWidget()
         layout_line_edit_ch1 = QFormLayout()
         layout_line_edit_ch1.addRow(QLabel("<b>Channel 1</b>"))
-        self.line_edit_clock_frequency = DelayedDoubleSpinBox()
-        self.line_edit_clock_frequency.setRange(53, 13998)
-        self.line_edit_clock_frequency.setValue(self._device.get_frequency(channel=1))
-        self.line_edit_clock_frequency.valueChanged.connect(
-            lambda: self._device.set_frequency(channel=1, frequency=self.line_edit_clock_frequency.text())
-        )
-        layout_line_edit_ch1.addRow(QLabel("Frequency / MHz"), self.line_edit_clock_frequency)
-        self.line_edit_amplitude_ch1 = DelayedDoubleSpinBox()
-        self.line_edit_amplitude_ch1.setRange(-60, 20)
-        self.line_edit_amplitude_ch1.setValue(self._device.get_amplitude(channel=1))
-        self.line_edit_amplitude_ch1.valueChanged.connect(
-            lambda: self._device.set_amplitude(channel=1, amplitude=self.line_edit_amplitude_ch1.text())
-        )
+        self.line_edit_frequency_ch1 = self._create_spin_box(
+            (53, 13998), self._device.get_frequency(channel=1),
+            lambda value: self._device.set_frequency(channel=1, frequency=value))
+        layout_line_edit_ch1.addRow(QLabel("Frequency / MHz"), self.line_edit_frequency_ch1)
+        self.line_edit_amplitude_ch1 = self._create_spin_box(
+            (-60, 20), self._device.get_amplitude(channel=1),
+            lambda value: self._device.set_amplitude(channel=1, amplitude=value))
         layout_line_edit_ch1.addRow(QLabel("Amplitude / dBm"), self.line_edit_amplitude_ch1)
         widget_line_edit_ch1.setLayout(layout_line_edit_ch1)
 
@@ -445,30 +432,24 @@ class SynthHDv2RFGWindow(QWidget):
         widget_line_edit_ch2 = QWidget()
         layout_line_edit_ch2 = QFormLayout()
         layout_line_edit_ch2.addRow(QLabel("<b>Channel 2</b>"))
-        self.line_edit_frequency_ch2 = DelayedDoubleSpinBox()
-        self.line_edit_frequency_ch2.setRange(53, 13998)
-        self.line_edit_frequency_ch2.setValue(float(self._device.get_frequency(channel=2)))
-        self.line_edit_frequency_ch2.valueChanged.connect(
-            lambda: self._device.set_frequency(channel=2, frequency=self.line_edit_frequency_ch2.text())
-        )
+        self.line_edit_frequency_ch2 = self._create_spin_box(
+            (53, 13998), self._device.get_frequency(channel=2),
+            lambda value: self._device.set_frequency(channel=2, frequency=value))
         layout_line_edit_ch2.addRow(QLabel("Frequency / MHz"), self.line_edit_frequency_ch2)
-        self.line_edit_amplitude_ch2 = DelayedDoubleSpinBox()
-        self.line_edit_amplitude_ch2.setRange(-60, 20)
-        self.line_edit_amplitude_ch2.setValue(float(self._device.get_amplitude(channel=2)))
-        self.line_edit_amplitude_ch2.valueChanged.connect(
-            lambda: self._device.set_amplitude(channel=2, amplitude=self.line_edit_amplitude_ch2.text())
-        )
+        self.line_edit_amplitude_ch2 = self._create_spin_box(
+            (-60, 20), self._device.get_amplitude(channel=2),
+            lambda value: self._device.set_amplitude(channel=2, amplitude=value))
         layout_line_edit_ch2.addRow(QLabel("Amplitude / dBm"), self.line_edit_amplitude_ch2)
         widget_line_edit_ch2.setLayout(layout_line_edit_ch2)
 
         # Buttons
         self.button_output_ch1 = ToggleButton(state=self._device.get_output(channel=1))
         self.button_output_ch1.clicked.connect(
-            lambda: self._device.set_output(channel=1, state=self.button_output_ch1.isChecked())
+            lambda checked: self._device.set_output(channel=1, state=checked)
         )
         self.button_output_ch2 = ToggleButton(state=self._device.get_output(channel=2))
         self.button_output_ch2.clicked.connect(
-            lambda: self._device.set_output(channel=2, state=self.button_output_ch1.isChecked())
+            lambda checked: self._device.set_output(channel=2, state=checked)
         )
 
         # Total Layout
@@ -490,6 +471,23 @@ class SynthHDv2RFGWindow(QWidget):
 
         self.show()
 
+    @staticmethod
+    def _create_spin_box(value_range, value, setter=None):
+        """
+        Create Spin Box with Range and initial Value
+        :param tuple value_range: Minimum and Maximum
+        :param float value: Initial Value, it is not written back to the Device
+        :param setter: Function called with the new Value once it stopped changing, None for no Connection
+        :return DelayedDoubleSpinBox: Spin Box
+        """
+        spin_box = DelayedDoubleSpinBox()
+        spin_box.setRange(*value_range)
+        with QSignalBlocker(spin_box):
+            spin_box.setValue(value)
+        if setter is not None:
+            spin_box.delayedValueChanged.connect(setter)    # NOQA
+        return spin_box
+
     @pyqtSlot()
     def _refresh_values(self):
         """
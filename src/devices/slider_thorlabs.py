@@ -84,16 +84,17 @@ class SliderThorlabsWindow(QWidget):
         number_devices = self._device.scan_devices()
         positions = self._device.get_position()
 
+        # The Device Number is bound as Default Argument, a Closure over 'i' would move the last Slider for every Button
         for i in range(number_devices):
             layout.addWidget(QLabel(f"Slider {i}"), i+1, 0)
             label_position = QLabel(str(positions[i]))
             self.label_positions.append(label_position)
             layout.addWidget(label_position, i+1, 1)
             button_forward = QPushButton("Forward")
-            button_forward.clicked.connect(lambda: self._device.move_forward(device=i+1))
+            button_forward.clicked.connect(lambda checked, device=i+1: self._device.move_forward(device=device))
             layout.addWidget(button_forward, i+1, 2)
             button_backward = QPushButton("Backward")
-            button_backward.clicked.connect(lambda: self._device.move_backward(device=i+1))
+            button_backward.clicked.connect(lambda checked, device=i+1: self._device.move_backward(device=device))
             layout.addWidget(button_backward, i+1, 3)
 
         print(self.label_positions)
@@ -0,0 +1,39 @@
+"""
+Reading of the initial Device State shown in a Device Window
+"""
+
+import logging
+
+from PyQt6.QtCore import pyqtSignal, QThread
+
+
+class StateReader(QThread):
+    """
+    Reads the Device State on a Worker Thread.
+    Either state_ready or state_failed is emitted, so the Window can always leave its loading State.
+    """
+
+    state_ready = pyqtSignal(dict)
+    state_failed = pyqtSignal(str)
+
+    def __init__(self, device, read_state):
+        """
+        :param device: Device
+        :param read_state: Function that reads the Device State and returns it as dict
+        """
+        super().__init__()
+        self._device = device
+        self._read_state = read_state
+
+    def run(self):
+        """
+        Read Device State
+        """
+        try:
+            state = self._read_state()
+        except (ConnectionError, ValueError, IndexError, KeyError) as err:
+            # Parse Errors of unexpected Answers are reported like Connection Errors
+            logging.error(f"{self._device.name}: Could not read State. Error: '{err}'.")
+            self.state_failed.emit(f"Could not read State. Error: '{err}'.")    # NOQA
+            return
+        self.state_ready.emit(state)    # NOQA
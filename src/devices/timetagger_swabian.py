@@ -40,6 +40,7 @@ class TimetaggerSwabian:
         if "Digital Channel" in self.settings:
             for name, value in self.settings["Digital Channel"].items():
                 self.digital_channel[name-1] = value
+        self._channel_index = {name: index for index, name in enumerate(self.digital_channel, start=1)}
 
     def get_channel_int(self, channel):
         """
@@ -47,7 +48,10 @@ class TimetaggerSwabian:
         :param int | str channel: Channel Name
         """
         if isinstance(channel, str):
-            return self.digital_channel.index(channel) + 1
+            try:
+                return self._channel_index[channel]
+            except KeyError:
+                raise ValueError(f"{self.name}: Unknown Channel '{channel}'") from None
         return channel
 
     def disconnect(self):
@@ -49,7 +49,7 @@ class CameraTab(QWidget):
             line_edit_camera_exposure_time.setDecimals(0)
             line_edit_camera_exposure_time.setValue(cam.get_exposure_time() * 1000)
             line_edit_camera_exposure_time.valueChanged.connect(    # NOQA
-                lambda: cam.set_exposure_time(line_edit_camera_exposure_time.value() / 1000))
+                lambda value: cam.set_exposure_time(value / 1000))
             layout_camera_settings.addRow(QLabel("Exposure Time / ms"), line_edit_camera_exposure_time)
             line_edit_camera_gain = QDoubleSpinBox()
             gain_lowest, gain_highest = cam.get_emccd_gain_range()
@@ -57,7 +57,7 @@ class CameraTab(QWidget):
             line_edit_camera_gain.setDecimals(0)
             line_edit_camera_gain.setValue(cam.get_emccd_gain())
             line_edit_camera_gain.valueChanged.connect(    # NOQA
-                lambda: cam.set_emccd_gain(int(line_edit_camera_gain.value())))
+                lambda value: cam.set_emccd_gain(int(value)))
             layout_camera_settings.addRow(QLabel("EMCCD Gain"), line_edit_camera_gain)
             self._label_camera_temperature = QLabel(str(cam.get_temperature()))
             layout_camera_settings.addRow(QLabel("Current Temperature / °C"), self._label_camera_temperature)
@@ -66,7 +66,7 @@ class CameraTab(QWidget):
             line_edit_camera_target_temperature.setDecimals(0)
             line_edit_camera_target_temperature.setValue(cam.get_target_temperature())
             line_edit_camera_target_temperature.valueChanged.connect(    # NOQA
-                lambda: cam.set_target_temperature(int(line_edit_camera_target_temperature.value())))
+                lambda value: cam.set_target_temperature(int(value)))
             layout_camera_settings.addRow(QLabel("Target Temperature / °C"), line_edit_camera_target_temperature)
 
             # Timer
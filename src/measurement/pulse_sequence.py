@@ -64,8 +64,30 @@ class Sequence:
         # "0, 0, 0, 0.1, 0.5, 0.6, 1, 1, 1, 0, 0, 0"
         # This string has to have a minimal length that is not checked for here, because it usually isn't problematic
 
-        return ', '.join(
-            [f"{pulse.level:.4f}" for pulse in self.sequence for _ in range(int(pulse.length*sample_rate))])
+        # Each level is formatted once per pulse instead of once per sample.
+        return ', '.join(', '.join([f"{pulse.level:.4f}"] * n_samples)
+                         for pulse, n_samples in zip(self.sequence, self._get_sample_counts(sample_rate)) if n_samples)
+
+    def get_sequence_keysight_awg_dac(self, sample_rate) -> np.ndarray:
+        """
+        Return Sequence as Keysight AWG DAC Values
+        :param float sample_rate: Sample Rate in Samples per Second
+        """
+        # DAC values are 16 bit integers, where 32767 is the maximum and -32768 the minimum of the output range.
+        # Levels from 0 to 1 are scaled the same way as in the ASCII format of get_sequence_keysight_awg.
+
+        # Each pulse level is converted once and then repeated for all of its samples.
+        # Levels outside of -1 to 1 are clipped to the DAC range, so they saturate instead of wrapping around in int16.
+        levels = np.round(np.array([pulse.level for pulse in self.sequence], dtype=float) * 32767)
+        levels = np.clip(levels, -32768, 32767).astype(np.int16)
+        return np.repeat(levels, self._get_sample_counts(sample_rate))
+
+    def _get_sample_counts(self, sample_rate) -> list:
+        """
+        Return Number of Samples of each Pulse
+        :param float sample_rate: Sample Rate in Samples per Second
+        """
+        return [int(pulse.length*sample_rate) for pulse in self.sequence]
 
 
 @dataclass
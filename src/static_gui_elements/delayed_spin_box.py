@@ -21,6 +21,7 @@ class DelayedSpinBox(QSpinBox):
         self._delay_timer.setSingleShot(True)
         self._delay_timer.timeout.connect(self._handle_delay_timer)    # NOQA
         self.valueChanged.connect(self._handle_value_changed)    # NOQA
+        self.editingFinished.connect(self._handle_editing_finished)    # NOQA
 
     @pyqtSlot()
     def _handle_value_changed(self):
@@ -29,6 +30,15 @@ class DelayedSpinBox(QSpinBox):
         """
         self._delay_timer.start(self.delay)
 
+    @pyqtSlot()
+    def _handle_editing_finished(self):
+        """
+        Emit pending delayedValueChanged signal immediately when editing is finished
+        """
+        if self._delay_timer.isActive():
+            self._delay_timer.stop()
+            self._handle_delay_timer()
+
     @pyqtSlot()
     def _handle_delay_timer(self):
         """
@@ -52,6 +62,7 @@ class DelayedDoubleSpinBox(QDoubleSpinBox):
         self._delay_timer.setSingleShot(True)
         self._delay_timer.timeout.connect(self._handle_delay_timer)    # NOQA
         self.valueChanged.connect(self._handle_value_changed)    # NOQA
+        self.editingFinished.connect(self._handle_editing_finished)    # NOQA
 
     @pyqtSlot()
     def _handle_value_changed(self):
@@ -60,9 +71,18 @@ class DelayedDoubleSpinBox(QDoubleSpinBox):
         """
         self._delay_timer.start(self.delay)
 
+    @pyqtSlot()
+    def _handle_editing_finished(self):
+        """
+        Emit pending delayedValueChanged signal immediately when editing is finished
+        """
+        if self._delay_timer.isActive():
+            self._delay_timer.stop()
+            self._handle_delay_timer()
+
     @pyqtSlot()
     def _handle_delay_timer(self):
         """
-        Emit delayedValueChanged(int) signal
+        Emit delayedValueChanged(float) signal
         """
         self.delayedValueChanged.emit(self.value())    # NOQA
@@ -22,12 +22,12 @@ class ToggleButton(QPushButton):
 
         self.setCheckable(True)
         self.setChecked(state)
-        self.clicked.connect(self._handle_clicked)
+        self.toggled.connect(self._handle_clicked)
         self._handle_clicked()
 
     def _handle_clicked(self):
         """
-        Change color when clicked
+        Change color when clicked or when the State is set with setChecked
         """
         if self.isChecked():
             self.setText(self.labels[0])